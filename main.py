@@ -15,31 +15,55 @@ Usage:
     python main.py --env dev                    # Use dev environment (small test data)
     python main.py --incidents path/to/file.csv # Override incidents file
     python main.py --requests path/to/file.csv  # Override requests file
+    python main.py --quiet                      # One-line score summary only
+    KPI_LOG=WARNING python main.py              # Suppress the results display
+    KPI_LOG=DEBUG python main.py                # Also print per-step timings
 """
 
 import sys
 import os
 import argparse
-import io
+import functools
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
-from pathlib import Path
-import pandas as pd
 
 # Fix Windows console encoding for Unicode characters
 if sys.platform == 'win32':
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.stderr.reconfigure(encoding='utf-8')
 
-from src import config_loader
-from src import load_data
-from src import transform
-from src import calculate_kpis
-from src import generate_reports
-from src.okr_calculator import OKRCalculator
 
+def _log_level(value):
+    """Resolve a KPI_LOG value (name or number) to a level, defaulting to INFO."""
+    value = value.strip()
+    if value.isdigit():
+        return int(value)
+    level = logging.getLevelName(value.upper())
+    if isinstance(level, int):
+        return level
+    print(f"ℹ Ignoring invalid KPI_LOG={value!r} - using INFO", file=sys.stderr)
+    return logging.INFO
 
-def parse_arguments():
-    """Parse command-line arguments."""
+
+# Result display logger - set KPI_LOG=WARNING to suppress the results block
+log = logging.getLogger("kpi_pipeline")
+_log_handler = logging.StreamHandler(sys.stdout)
+_log_handler.setFormatter(logging.Formatter("%(message)s"))
+log.addHandler(_log_handler)
+log.setLevel(_log_level(os.environ.get("KPI_LOG", "INFO")))
+log.propagate = False
+
+# Directory for generated Excel reports
+OUTPUT_DIR = "data/output"
+
+
+@functools.cache
+def _get_parser():
+    """Build the command-line argument parser (constructed once per process)."""
     parser = argparse.ArgumentParser(
         description='KPI Pipeline - Calculate and report KPI metrics',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -50,6 +74,7 @@ Examples:
   python main.py --incidents custom_incidents.csv   # Override incidents file
   python main.py --requests custom_requests.csv     # Override requests file
   python main.py --input-dir data/archive           # Use different input directory
+  python main.py --quiet                            # Print only the overall score line
         """
     )
     
@@ -80,7 +105,38 @@ Examples:
         help='Path to KPI config file (default: config/kpi_config.yaml)'
     )
     
-    return parser.parse_args()
+    parser.add_argument(
+        '--quiet',
+        action='store_true',
+        help='Skip the results display and print a one-line score summary'
+    )
+    
+    return parser
+
+
+@contextmanager
+def _phase(name):
+    """Time a pipeline step and log its wall time (shown with KPI_LOG=DEBUG)."""
+    t0 = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        log.debug("[timing] %s: %.1f ms", name, (time.perf_counter_ns() - t0) / 1e6)
+
+
+def _preload_modules():
+    """Import the heavy pipeline dependencies (run in a background thread)."""
+    try:
+        import pandas  # noqa: F401
+        import openpyxl  # noqa: F401
+    except ImportError:
+        # Re-raised with a proper traceback by the main thread's imports
+        pass
+
+
+def parse_arguments():
+    """Parse command-line arguments."""
+    return _get_parser().parse_args()
 
 
 def get_data_file_paths(config, args):
@@ -111,7 +167,7 @@ def get_data_file_paths(config, args):
     
     if args.incidents:
         # If absolute path or contains directory separator, use as-is
-        if Path(args.incidents).is_absolute() or os.sep in args.incidents:
+        if os.path.isabs(args.incidents) or os.sep in args.incidents:
             incidents_path = args.incidents
         else:
             incidents_path = os.path.join(input_dir, args.incidents)
@@ -119,7 +175,7 @@ def get_data_file_paths(config, args):
         incidents_path = os.path.join(input_dir, incidents_file)
     
     if args.requests:
-        if Path(args.requests).is_absolute() or os.sep in args.requests:
+        if os.path.isabs(args.requests) or os.sep in args.requests:
             requests_path = args.requests
         else:
             requests_path = os.path.join(input_dir, args.requests)
@@ -134,169 +190,162 @@ def main():
     # Parse command-line arguments
     args = parse_arguments()
     
-    print("="*70)
+    # Pipeline imports (pandas, openpyxl) are deferred until after argument
+    # parsing so --help and argument errors return immediately, and run
+    # in a background thread while the configuration loads
+    preload = threading.Thread(target=_preload_modules, daemon=True)
+    preload.start()
+    from src.display import SEP_EQ
+    
+    print(SEP_EQ)
     print("KPI PIPELINE - EXECUTION")
-    print("="*70)
-    print(f"Start Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(SEP_EQ)
+    start_ts = datetime.now()
+    print(f"Start Time: {start_ts.strftime('%Y-%m-%d %H:%M:%S')}")
     print()
     
     try:
-        # Step 1: Load Configuration
-        print("[1/7] Loading configuration...")
-        config = config_loader.load_config(args.config)
-        print(f"✓ Configuration loaded: {config['metadata']['organization']}")
+        from src import config_loader
         
-        # Get data file paths from config and CLI args
-        incidents_path, requests_path, env = get_data_file_paths(config, args)
+        # Step 1: Load Configuration
+        with _phase("Step 1: Load configuration"):
+            print("[1/7] Loading configuration...")
+            config = config_loader.load_config(args.config)
+            print(f"✓ Configuration loaded: {config['metadata']['organization']}")
+            
+            # Get data file paths from config and CLI args
+            incidents_path, requests_path, env = get_data_file_paths(config, args)
+            
+            # Display environment info
+            env_desc = config['data_sources']['environments'][env]['description']
+            print(f"✓ Environment: {env} ({env_desc})")
         
-        # Display environment info
-        env_desc = config['data_sources']['environments'][env]['description']
-        print(f"✓ Environment: {env} ({env_desc})")
+        preload.join()
+        from src import load_data
+        from src import transform
+        from src import calculate_kpis
+        from src import generate_reports
+        from src import display
+        from src.okr_calculator import OKRCalculator
         
         # Step 2: Load Data
-        print("\n[2/7] Loading data files...")
-        print(f"  Incidents: {incidents_path}")
-        incidents = load_data.load_incidents(incidents_path, config)
-        print(f"✓ Loaded {len(incidents)} incidents")
-        
-        requests = None
-        if config['kpis']['SM003']['enabled']:
-            print(f"  Requests: {requests_path}")
-            requests = load_data.load_requests(requests_path, config)
-            print(f"✓ Loaded {len(requests)} requests")
-        else:
-            print("ℹ Request aging (SM003) disabled - skipping request data")
+        # Incidents and requests are independent files, so load them
+        # concurrently - pandas releases the GIL while parsing CSV
+        with _phase("Step 2: Load data"):
+            print("\n[2/7] Loading data files...")
+            print(f"  Incidents: {incidents_path}")
+            requests_enabled = config['kpis']['SM003']['enabled']
+            if requests_enabled:
+                print(f"  Requests: {requests_path}")
+            
+            # Loader progress output is off while loading concurrently (it
+            # would interleave); the summaries below print in a fixed order
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                incidents_future = executor.submit(
+                    load_data.load_incidents, incidents_path, config,
+                    use_pyarrow=True, cache_dir="data/cache", verbose=False
+                )
+                requests_future = None
+                if requests_enabled:
+                    requests_future = executor.submit(
+                        load_data.load_requests, requests_path, config,
+                        use_pyarrow=True, cache_dir="data/cache", verbose=False
+                    )
+                
+                incidents = incidents_future.result()
+                requests = requests_future.result() if requests_future else None
+            
+            print(f"✓ Loaded {len(incidents)} incidents")
+            if requests is not None:
+                print(f"✓ Loaded {len(requests)} requests")
+            else:
+                print("ℹ Request aging (SM003) disabled - skipping request data")
         
         # Step 3: Transform Data
-        print("\n[3/7] Transforming data (adding calculated fields)...")
-        incidents = transform.add_incident_flags(incidents, config)
-        print(f"✓ Added incident flags")
-        
-        if requests is not None:
-            requests = transform.add_request_flags(requests, config)
-            print(f"✓ Added request flags")
+        with _phase("Step 3: Transform data"):
+            print("\n[3/7] Transforming data (adding calculated fields)...")
+            incidents = transform.add_incident_flags(incidents, config)
+            print(f"✓ Added incident flags")
+            
+            if requests is not None:
+                requests = transform.add_request_flags(requests, config)
+                print(f"✓ Added request flags")
         
         # Step 4: Calculate KPIs
-        print("\n[4/7] Calculating KPIs...")
-        kpi_results = calculate_kpis.calculate_all(incidents, requests, config)
-        print(f"✓ Calculated {len(kpi_results)-1} KPIs + overall score")
+        with _phase("Step 4: Calculate KPIs"):
+            print("\n[4/7] Calculating KPIs...")
+            kpi_results = calculate_kpis.calculate_all(incidents, requests, config)
+            print(f"✓ Calculated {len(kpi_results)-1} KPIs + overall score")
         
         # Step 5: Calculate OKR Scores
-        print("\n[5/7] Calculating OKR scores...")
-        
-        okr_calc = OKRCalculator('config/okr_config.yaml', kpi_results)
-        okr_results = okr_calc.calculate_overall_okr()
-        action_triggers = okr_calc.get_action_triggers()
-        
-        print(f"✓ Calculated OKR R002 with {len(okr_results['key_results'])} Key Results")
-        print(f"✓ Overall OKR Score: {okr_results['overall_score']}%")
-        
-        # Step 6: Display Results
-        print("\n[6/7] Results:")
-        print("\n" + "="*70)
-        print("KPI RESULTS")
-        print("="*70)
-        
-        for kpi_code, kpi_data in kpi_results.items():
-            if kpi_code == 'OVERALL':
-                print(f"\n{'='*70}")
-                print(f"OVERALL PERFORMANCE")
-                print(f"{'='*70}")
-                print(f"Score: {kpi_data['Overall_Score']}%")
-                print(f"Status: {kpi_data['Overall_Status']}")
-                print(f"Weights: {kpi_data['Weights_Used']}")
-            else:
-                print(f"\n{kpi_code}: {kpi_data['KPI_Name']}")
-                print(f"  Status: {kpi_data['Status']}")
-                print(f"  Adherence: {kpi_data['Adherence_Rate']}%")
-                print(f"  Business Impact: {kpi_data['Business_Impact']}")
-                
-                # Print KPI-specific details
-                if 'P1_Count' in kpi_data:
-                    print(f"  P1: {kpi_data['P1_Count']} (target: ≤{kpi_data['P1_Target']})")
-                    print(f"  P2: {kpi_data['P2_Count']} (target: ≤{kpi_data['P2_Target']})")
-                    print(f"  Total Major: {kpi_data['Total_Major']}")
-                elif 'Backlog_Count' in kpi_data:
-                    print(f"  Total: {kpi_data['Total_Incidents']}")
-                    print(f"  Backlog: {kpi_data['Backlog_Count']} ({kpi_data['Backlog_Percentage']}%)")
-                    print(f"  Target: ≥{kpi_data['Target_Adherence']}% adherence")
-                elif 'Aged_Count' in kpi_data:
-                    print(f"  Total: {kpi_data['Total_Requests']}")
-                    print(f"  Aged: {kpi_data['Aged_Count']} ({kpi_data['Aged_Percentage']}%)")
-                    print(f"  Target: ≥{kpi_data['Target_Adherence']}% adherence")
-                elif 'FCR_Count' in kpi_data:
-                    print(f"  Total Resolved: {kpi_data['Total_Resolved']}")
-                    print(f"  FCR: {kpi_data['FCR_Count']} ({kpi_data['FCR_Percentage']}%)")
-                    print(f"  Target: ≥{kpi_data['Target_Rate']}%")
-        
-        # Display OKR Results
-        print("\n" + "="*70)
-        print("OKR R002 RESULTS")
-        print("="*70)
-        print(f"\nObjective: {okr_results['objective']}")
-        print(f"Overall Score: {okr_results['overall_score']}%")
-        print(f"Status: {okr_results['overall_status']}")
-        print(f"\nKey Results:")
-        print("-"*70)
-        
-        for kr_id in ['KR3', 'KR4', 'KR5', 'KR6']:
-            kr = okr_results['key_results'][kr_id]
-            print(f"\n{kr_id}: {kr['name']}")
-            print(f"  Score: {kr['score']}%")
-            print(f"  Status: {kr['status']}")
-            print(f"  Current: {kr['current_value']} {kr['target_operator']} {kr['target_value']} (target)")
-            print(f"  Gap to Target: {kr['gap_to_target']}")
-            print(f"  Owner: {kr['owner']}")
-        
-        # Display Action Triggers
-        if action_triggers['critical'] or action_triggers['warning']:
-            print("\n" + "="*70)
-            print("ACTION TRIGGERS")
-            print("="*70)
+        with _phase("Step 5: Calculate OKR scores"):
+            print("\n[5/7] Calculating OKR scores...")
             
-            if action_triggers['critical']:
-                print("\n🔴 CRITICAL ACTIONS REQUIRED:")
-                for trigger in action_triggers['critical']:
-                    print(f"  {trigger['kr_id']}: {trigger['action']}")
-                    print(f"    → Escalate to: {trigger['escalation']}")
+            okr_calc = OKRCalculator('config/okr_config.yaml', kpi_results)
+            okr_results = okr_calc.calculate_overall_okr()
+            action_triggers = okr_calc.get_action_triggers(okr_results)
             
-            if action_triggers['warning']:
-                print("\n🟡 WARNING ACTIONS:")
-                for trigger in action_triggers['warning']:
-                    print(f"  {trigger['kr_id']}: {trigger['action']}")
-                    print(f"    → Escalate to: {trigger['escalation']}")
-        
-        # Step 7: Generate Excel Report
-        print("\n[7/7] Generating Excel report...")
+            print(f"✓ Calculated OKR R002 with {len(okr_results['key_results'])} Key Results")
+            print(f"✓ Overall OKR Score: {okr_results['overall_score']}%")
         
-        # Create output directory
-        output_dir = "data/output"
-        os.makedirs(output_dir, exist_ok=True)
+        # Start Excel report generation in the background - writing the
+        # workbook is I/O-bound and overlaps with the console display below
+        output_dir = OUTPUT_DIR
+        if not os.path.isdir(output_dir):
+            os.makedirs(output_dir, exist_ok=True)
         
-        # Generate timestamped filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Generate timestamped filename (matches the run's start time)
+        timestamp = start_ts.strftime("%Y%m%d_%H%M%S")
         env_suffix = f"_{env}" if env != "prod" else ""
         output_file = f"{output_dir}/KPI_Report{env_suffix}_{timestamp}.xlsx"
         
-        print(f"  Output file: {output_file}")
-        
-        # Generate Excel report (with OKR data)
-        generate_reports.generate_excel_report(
-            kpi_results=kpi_results,
-            okr_results=okr_results,
-            action_triggers=action_triggers,
-            incidents=incidents,
-            requests=requests if requests is not None else pd.DataFrame(),
-            config=config,
-            output_path=output_file
-        )
-        
-        print(f"✓ Excel report generated successfully")
+        # Generate Excel report (with OKR data); leaving the with block waits
+        # for the writer even if a later step raises
+        with ThreadPoolExecutor(max_workers=1) as report_executor:
+            report_future = report_executor.submit(
+                generate_reports.generate_excel_report,
+                kpi_results=kpi_results,
+                okr_results=okr_results,
+                action_triggers=action_triggers,
+                incidents=incidents,
+                requests=requests,
+                config=config,
+                output_path=output_file,
+                generated_at=start_ts
+            )
+            
+            # Step 6: Display Results
+            # Collect output lines and emit them as a single log record;
+            # skipped entirely with --quiet or when KPI_LOG is set above INFO
+            with _phase("Step 6: Display results"):
+                if args.quiet:
+                    overall = kpi_results['OVERALL']
+                    print(f"\nScore: {overall['Overall_Score']}% Status: {overall['Overall_Status']}")
+                elif log.isEnabledFor(logging.INFO):
+                    lines = ["\n[6/7] Results:"]
+                    lines.extend(display.format_kpi_results(kpi_results))
+                    lines.extend(display.format_okr_results(okr_results, action_triggers))
+                    log.info("\n".join(lines))
+            
+            # Step 7: Generate Excel Report
+            # Timing covers only the wait for the background writer
+            with _phase("Step 7: Generate Excel report"):
+                # Wait for the background report writer (re-raises any failure)
+                report_written = report_future.result()
+            
+                if report_written:
+                    print("\n[7/7] Generating Excel report...")
+                    print(f"  Output file: {output_file}")
+                    print(f"✓ Excel report generated successfully")
+                else:
+                    print("\n[7/7] ℹ No incident or request data - Excel report not written")
         
-        print("\n" + "="*70)
+        print("\n" + SEP_EQ)
         print(f"✓ Pipeline completed successfully")
-        print(f"End Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print("="*70)
+        end_ts = datetime.now()
+        print(f"End Time: {end_ts.strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"Elapsed: {(end_ts - start_ts).total_seconds():.1f}s")
+        print(SEP_EQ)
         
         return 0
         
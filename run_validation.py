@@ -8,13 +8,12 @@ Usage:
 
 import sys
 import subprocess
-import io
 from pathlib import Path
 
 # Fix Windows console encoding for Unicode characters
 if sys.platform == 'win32':
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.stderr.reconfigure(encoding='utf-8')
 
 def main():
     """Run the validation test suite."""
@@ -24,10 +23,27 @@ def main():
     print()
     
     try:
-        # Run the validation tests (standalone version)
-        result = subprocess.run([
-            sys.executable, 'src/run_validation_tests_standalone.py'
-        ], check=True)
+        # Run the validation tests in-process (standalone version); fall
+        # back to a subprocess only if the module cannot be imported
+        try:
+            from src.run_validation_tests_standalone import main as run_validation_main
+        except ImportError:
+            run_validation_main = None
+        
+        if run_validation_main is not None:
+            try:
+                run_validation_main()
+                returncode = 0
+            except SystemExit as e:
+                returncode = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        else:
+            returncode = subprocess.run([
+                sys.executable, 'src/run_validation_tests_standalone.py'
+            ]).returncode
+        
+        if returncode != 0:
+            print(f"\nVALIDATION TESTS FAILED (exit code: {returncode})")
+            return returncode
         
         print("\n" + "="*70)
         print("VALIDATION TESTS COMPLETED SUCCESSFULLY")
@@ -35,10 +51,6 @@ def main():
         
         return 0
         
-    except subprocess.CalledProcessError as e:
-        print(f"\nVALIDATION TESTS FAILED (exit code: {e.returncode})")
-        return e.returncode
-        
     except Exception as e:
         print(f"\nERROR RUNNING VALIDATION TESTS: {e}")
         return 1
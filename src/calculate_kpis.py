@@ -3,23 +3,113 @@ KPI calculation module for KPI pipeline.
 Calculates all KPIs and determines overall status.
 """
 
+import csv
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import numpy as np
 import pandas as pd
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 
 # Handle both relative and absolute imports
 try:
     from . import config_loader
+    from . import load_data, transform
+    from .load_data import extract_priority_number
 except ImportError:
     import config_loader
+    import load_data
+    import transform
+    from load_data import extract_priority_number
+
+
+# Incident flag columns counted in a single pass by calculate_all
+INCIDENT_FLAG_COLUMNS = [
+    'Is_P1',
+    'Is_P2',
+    'Is_Major_Incident',
+    'Is_Backlog',
+    'Is_Resolved',
+    'Is_First_Call_Resolution',
+]
+
+# KPI weight code -> key of its entry in the calculate_all results
+# (SM003/KR5 is not part of the weighted overall score)
+CODE_TO_RESULT_KEY = {
+    'SM001': 'SM001',
+    'SM002': 'SM002/KR4',
+    'SM004': 'SM004/KR6',
+}
+
+
+def _count_flags(df: pd.DataFrame, cols: List[str]) -> Dict[str, int]:
+    """
+    Count True values in several flag columns with one pass over the data.
+    
+    The columns are stacked into a single (rows x cols) bool array so all
+    counts come from one sweep instead of one reduction per column. When both
+    Is_Resolved and Is_First_Call_Resolution are included, the count of
+    resolved first-call resolutions is added under 'Resolved_FCR'.
+    
+    Args:
+        df: DataFrame with boolean flag columns
+        cols: Flag column names to count
+        
+    Returns:
+        Dictionary mapping column name to number of True values, plus the
+        row count under 'Total'
+    """
+    flags = df[cols].to_numpy(dtype=bool)
+    totals = np.count_nonzero(flags, axis=0)
+    counts = {col: int(total) for col, total in zip(cols, totals)}
+    counts['Total'] = len(df)
+    
+    if 'Is_Resolved' in counts and 'Is_First_Call_Resolution' in counts:
+        resolved = flags[:, cols.index('Is_Resolved')]
+        fcr = flags[:, cols.index('Is_First_Call_Resolution')]
+        counts['Resolved_FCR'] = int(np.count_nonzero(resolved & fcr))
+    
+    return counts
 
 
-def calculate_sm001_major_incidents(df: pd.DataFrame, config: Dict[str, Any]) -> Dict[str, Any]:
+# Flag counts of an empty data set (read-only; used by the calculate_all
+# fast path and as the starting point for the streaming counters)
+EMPTY_INCIDENT_COUNTS = dict.fromkeys(INCIDENT_FLAG_COLUMNS + ['Resolved_FCR', 'Total'], 0)
+EMPTY_REQUEST_COUNTS = {'Is_Aged': 0, 'Total': 0}
+
+# Shared pool for the independent incident/request flag reductions in
+# calculate_all (NumPy releases the GIL while counting)
+_KPI_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix='kpi')
+
+# Status labels for KPI adherence bands and overall performance bands,
+# ordered from the lowest band to the highest
+KPI_STATUS_LABELS = ['Critical', 'Warning', 'Met']
+OVERALL_STATUS_LABELS = ['Poor', 'Needs Improvement', 'Good', 'Excellent']
+
+
+def _status_from_bands(score: float, bands: List[float], labels: List[str]) -> str:
+    """
+    Classify a score into a status band with a binary search.
+    
+    Args:
+        score: Value to classify
+        bands: Ascending lower bounds of every band above the lowest
+        labels: Band labels, one more than bands, lowest band first
+        
+    Returns:
+        Label of the band the score falls into (bounds are inclusive)
+    """
+    return labels[int(np.searchsorted(bands, score, side='right'))]
+
+
+def calculate_sm001_major_incidents(df: pd.DataFrame, config: Dict[str, Any],
+                                    counts: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
     """
     Calculate SM001: Major Incidents (P1 & P2).
     
     Args:
         df: Incident DataFrame with calculated flags
         config: Configuration dictionary
+        counts: Optional precomputed flag counts (from _count_flags)
         
     Returns:
         Dictionary with KPI results
@@ -27,9 +117,11 @@ def calculate_sm001_major_incidents(df: pd.DataFrame, config: Dict[str, Any]) ->
     kpi_config = config['kpis']['SM001']
     
     # Count P1 and P2 incidents
-    p1_count = df['Is_P1'].sum()
-    p2_count = df['Is_P2'].sum()
-    total_major = df['Is_Major_Incident'].sum()
+    if counts is None:
+        counts = _count_flags(df, ['Is_P1', 'Is_P2', 'Is_Major_Incident'])
+    p1_count = counts['Is_P1']
+    p2_count = counts['Is_P2']
+    total_major = counts['Is_Major_Incident']
     
     # Get targets
     p1_max = kpi_config['targets']['p1_max']
@@ -60,13 +152,15 @@ def calculate_sm001_major_incidents(df: pd.DataFrame, config: Dict[str, Any]) ->
     }
 
 
-def calculate_sm002_backlog(df: pd.DataFrame, config: Dict[str, Any]) -> Dict[str, Any]:
+def calculate_sm002_backlog(df: pd.DataFrame, config: Dict[str, Any],
+                            counts: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
     """
     Calculate SM002/KR4: ServiceNow Backlog.
     
     Args:
         df: Incident DataFrame with calculated flags
         config: Configuration dictionary
+        counts: Optional precomputed flag counts (from _count_flags)
         
     Returns:
         Dictionary with KPI results
@@ -74,8 +168,10 @@ def calculate_sm002_backlog(df: pd.DataFrame, config: Dict[str, Any]) -> Dict[st
     kpi_config = config['kpis']['SM002']
     
     # Count total and backlog
-    total_incidents = len(df)
-    backlog_count = df['Is_Backlog'].sum()
+    if counts is None:
+        counts = _count_flags(df, ['Is_Backlog'])
+    total_incidents = counts['Total']
+    backlog_count = counts['Is_Backlog']
     backlog_percentage = (backlog_count / total_incidents * 100) if total_incidents > 0 else 0
     
     # Calculate adherence (inverse of backlog %)
@@ -105,13 +201,15 @@ def calculate_sm002_backlog(df: pd.DataFrame, config: Dict[str, Any]) -> Dict[st
     }
 
 
-def calculate_kr5_request_aging(df: pd.DataFrame, config: Dict[str, Any]) -> Dict[str, Any]:
+def calculate_kr5_request_aging(df: pd.DataFrame, config: Dict[str, Any],
+                                counts: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
     """
     Calculate KR5: Service Request Aging.
     
     Args:
         df: Request DataFrame with calculated flags
         config: Configuration dictionary
+        counts: Optional precomputed flag counts (from _count_flags)
         
     Returns:
         Dictionary with KPI results
@@ -119,8 +217,10 @@ def calculate_kr5_request_aging(df: pd.DataFrame, config: Dict[str, Any]) -> Dic
     kpi_config = config['kpis']['SM003']
     
     # Count total and aged
-    total_requests = len(df)
-    aged_count = df['Is_Aged'].sum()
+    if counts is None:
+        counts = _count_flags(df, ['Is_Aged'])
+    total_requests = counts['Total']
+    aged_count = counts['Is_Aged']
     aged_percentage = (aged_count / total_requests * 100) if total_requests > 0 else 0
     
     # Calculate adherence (inverse of aged %)
@@ -150,37 +250,39 @@ def calculate_kr5_request_aging(df: pd.DataFrame, config: Dict[str, Any]) -> Dic
     }
 
 
-def calculate_sm004_fcr(df: pd.DataFrame, config: Dict[str, Any]) -> Dict[str, Any]:
+def calculate_sm004_fcr(df: pd.DataFrame, config: Dict[str, Any],
+                        counts: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
     """
     Calculate SM004/KR6: First Call Resolution Rate.
     
     Args:
         df: Incident DataFrame with calculated flags
         config: Configuration dictionary
+        counts: Optional precomputed flag counts (from _count_flags)
         
     Returns:
         Dictionary with KPI results
     """
     kpi_config = config['kpis']['SM004']
     
-    # Count resolved incidents only
-    resolved_df = df[df['Is_Resolved']]
-    total_resolved = len(resolved_df)
-    
-    # Count first call resolutions (zero reassignments + not excluded contact type)
-    fcr_count = resolved_df['Is_First_Call_Resolution'].sum()
+    if counts is not None:
+        total_resolved = counts['Is_Resolved']
+        fcr_count = counts['Resolved_FCR']
+    else:
+        # Count resolved incidents only (masked counts - no DataFrame slice)
+        resolved = df['Is_Resolved'].to_numpy(dtype=bool, copy=False)
+        fcr = df['Is_First_Call_Resolution'].to_numpy(dtype=bool, copy=False)
+        total_resolved = int(np.count_nonzero(resolved))
+        
+        # Count first call resolutions (zero reassignments + not excluded contact type)
+        fcr_count = int(np.count_nonzero(resolved & fcr))
     fcr_percentage = (fcr_count / total_resolved * 100) if total_resolved > 0 else 0
     
     # Get target
     target_rate = kpi_config['targets']['ftf_rate_min']
     
     # Determine status
-    if fcr_percentage >= target_rate:
-        status = "Met"
-    elif fcr_percentage >= (target_rate - 10):
-        status = "Warning"
-    else:
-        status = "Critical"
+    status = _status_from_bands(fcr_percentage, [target_rate - 10, target_rate], KPI_STATUS_LABELS)
     
     return {
         'KPI_Code': 'SM004/KR6',
@@ -217,14 +319,10 @@ def calculate_overall_score(kpi_results: Dict[str, Dict], config: Dict[str, Any]
     
     for kpi_code, weight in weights.items():
         # Map KPI code to result key
-        if kpi_code == 'SM001' and 'SM001' in kpi_results:
-            adherence = kpi_results['SM001']['Adherence_Rate']
-        elif kpi_code == 'SM002' and 'SM002/KR4' in kpi_results:
-            adherence = kpi_results['SM002/KR4']['Adherence_Rate']
-        elif kpi_code == 'SM004' and 'SM004/KR6' in kpi_results:
-            adherence = kpi_results['SM004/KR6']['Adherence_Rate']
-        else:
+        key = CODE_TO_RESULT_KEY.get(kpi_code)
+        if key is None or key not in kpi_results:
             continue
+        adherence = kpi_results[key]['Adherence_Rate']
         
         kpi_scores[kpi_code] = adherence
         total_score += (adherence * weight / 100)
@@ -235,14 +333,11 @@ def calculate_overall_score(kpi_results: Dict[str, Dict], config: Dict[str, Any]
     
     # Determine overall status
     bands = config['global_status_rules']['performance_bands']
-    if overall_score >= bands['excellent']:
-        overall_status = "Excellent"
-    elif overall_score >= bands['good']:
-        overall_status = "Good"
-    elif overall_score >= bands['needs_improvement']:
-        overall_status = "Needs Improvement"
-    else:
-        overall_status = "Poor"
+    overall_status = _status_from_bands(
+        overall_score,
+        [bands['needs_improvement'], bands['good'], bands['excellent']],
+        OVERALL_STATUS_LABELS
+    )
     
     return {
         'Overall_Score': round(overall_score, 1),
@@ -267,21 +362,37 @@ def calculate_all(incidents: pd.DataFrame, requests: pd.DataFrame, config: Dict[
     """
     results = {}
     
+    requests_enabled = config['kpis']['SM003']['enabled'] and requests is not None
+    
+    if len(incidents) == 0 and (requests is None or len(requests) == 0):
+        # Fast path: no rows at all, so skip the DataFrame reductions
+        incident_counts = EMPTY_INCIDENT_COUNTS
+        request_counts = EMPTY_REQUEST_COUNTS
+    else:
+        # Count all incident flags in one pass, shared by SM001/SM002/SM004,
+        # while the request flags are counted concurrently for SM003/KR5
+        incident_future = _KPI_EXECUTOR.submit(_count_flags, incidents, INCIDENT_FLAG_COLUMNS)
+        request_future = None
+        if requests_enabled:
+            request_future = _KPI_EXECUTOR.submit(_count_flags, requests, ['Is_Aged'])
+        incident_counts = incident_future.result()
+        request_counts = request_future.result() if request_future is not None else None
+    
     # SM001: Major Incidents
     if config['kpis']['SM001']['enabled']:
-        results['SM001'] = calculate_sm001_major_incidents(incidents, config)
+        results['SM001'] = calculate_sm001_major_incidents(incidents, config, incident_counts)
     
     # SM002/KR4: Backlog
     if config['kpis']['SM002']['enabled']:
-        results['SM002/KR4'] = calculate_sm002_backlog(incidents, config)
+        results['SM002/KR4'] = calculate_sm002_backlog(incidents, config, incident_counts)
     
     # SM003/KR5: Request Aging (if enabled and data available)
-    if config['kpis']['SM003']['enabled'] and requests is not None:
-        results['SM003/KR5'] = calculate_kr5_request_aging(requests, config)
+    if requests_enabled:
+        results['SM003/KR5'] = calculate_kr5_request_aging(requests, config, request_counts)
     
     # SM004/KR6: First Call Resolution
     if config['kpis']['SM004']['enabled']:
-        results['SM004/KR6'] = calculate_sm004_fcr(incidents, config)
+        results['SM004/KR6'] = calculate_sm004_fcr(incidents, config, incident_counts)
     
     # Calculate overall score
     results['OVERALL'] = calculate_overall_score(results, config)
@@ -289,6 +400,230 @@ def calculate_all(incidents: pd.DataFrame, requests: pd.DataFrame, config: Dict[
     return results
 
 
+def _parse_timestamp(value: str) -> Optional[datetime]:
+    """
+    Parse a CSV timestamp the same way as the DataFrame path.
+    
+    ISO values (e.g. 2025-08-28 09:05:16) take the fast fromisoformat path;
+    anything else is handed to pd.to_datetime, as used by load_data.
+    
+    Args:
+        value: Raw timestamp field from the CSV
+        
+    Returns:
+        Parsed datetime, or None if the field is empty
+        
+    Raises:
+        ValueError: If the value is not a recognisable timestamp
+    """
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return pd.to_datetime(value).to_pydatetime()
+
+
+def _stream_incident_counts(filepath: str, config: Dict[str, Any]) -> Dict[str, int]:
+    """
+    Count incident flags row by row straight from the CSV file.
+    
+    Applies the same predicates as load_data.load_incidents and
+    transform.add_incident_flags without building a DataFrame.
+    
+    Args:
+        filepath: Path to incidents CSV file
+        config: Configuration dictionary
+        
+    Returns:
+        Flag counts in the format produced by _count_flags
+    """
+    major_priorities = set(config['thresholds']['priority']['major_incident_levels'])
+    backlog_threshold = config['thresholds']['aging']['backlog_days']
+    fallback = config['processing']['priority_extraction']['fallback_value']
+    excluded_contact_types = set(
+        config['kpis']['SM004'].get('exclusions', {}).get('contact_types', [])
+    )
+    current_time = datetime.now()
+    
+    counts = dict(EMPTY_INCIDENT_COUNTS)
+    
+    with open(filepath, newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        col = {name: i for i, name in enumerate(header)}
+        priority_idx = col['priority']
+        opened_idx = col['opened_at']
+        resolved_idx = col.get('u_resolved', col.get('resolved_at'))
+        reassign_idx = col['reassignment_count']
+        contact_idx = col.get('contact_type')
+        
+        for row in reader:
+            counts['Total'] += 1
+            
+            # Priority flags
+            priority = extract_priority_number(row[priority_idx] or None, fallback)
+            if priority == 1:
+                counts['Is_P1'] += 1
+            elif priority == 2:
+                counts['Is_P2'] += 1
+            if priority in major_priorities:
+                counts['Is_Major_Incident'] += 1
+            
+            # Backlog: resolved after threshold days, or still open past it
+            opened = _parse_timestamp(row[opened_idx])
+            resolved = _parse_timestamp(row[resolved_idx]) if resolved_idx is not None else None
+            is_resolved = resolved is not None
+            if opened is not None:
+                end = resolved if is_resolved else current_time
+                if (end - opened).total_seconds() / 86400 > backlog_threshold:
+                    counts['Is_Backlog'] += 1
+            
+            # First call resolution (zero reassignments + not excluded contact type)
+            reassignments = row[reassign_idx]
+            is_fcr = not reassignments or float(reassignments) == 0
+            if is_fcr and contact_idx is not None:
+                is_fcr = row[contact_idx] not in excluded_contact_types
+            
+            if is_resolved:
+                counts['Is_Resolved'] += 1
+                if is_fcr:
+                    counts['Resolved_FCR'] += 1
+            if is_fcr:
+                counts['Is_First_Call_Resolution'] += 1
+    
+    return counts
+
+
+def _stream_request_counts(filepath: str, config: Dict[str, Any]) -> Dict[str, int]:
+    """
+    Count aged requests row by row straight from the CSV file.
+    
+    Args:
+        filepath: Path to requests CSV file
+        config: Configuration dictionary
+        
+    Returns:
+        Flag counts in the format produced by _count_flags
+    """
+    aging_threshold = config['thresholds']['aging'].get('request_aging_days', 30)
+    opened_col = config.get('column_mappings', {}).get('opened_at', 'opened_at')
+    current_time = datetime.now()
+    
+    counts = dict(EMPTY_REQUEST_COUNTS)
+    
+    with open(filepath, newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        opened_idx = header.index(opened_col)
+        
+        for row in reader:
+            counts['Total'] += 1
+            opened = _parse_timestamp(row[opened_idx])
+            if opened is not None and (current_time - opened).total_seconds() / 86400 > aging_threshold:
+                counts['Is_Aged'] += 1
+    
+    return counts
+
+
+def calculate_all_streaming(incidents_path: str, requests_path: Optional[str],
+                            config: Dict[str, Any]) -> Dict[str, Dict]:
+    """
+    Calculate all enabled KPIs by streaming the CSV files with csv.reader.
+    
+    Produces the same results as calculate_all without loading the data into
+    DataFrames, for runs that only need the KPI figures (the Excel report
+    still needs the DataFrame path). Non-empty timestamps that cannot be
+    parsed raise ValueError rather than being counted as missing.
+    
+    Args:
+        incidents_path: Path to incidents CSV file
+        requests_path: Path to requests CSV file (None to skip SM003)
+        config: Configuration dictionary
+        
+    Returns:
+        Dictionary of all KPI results
+    """
+    results = {}
+    
+    incident_counts = _stream_incident_counts(incidents_path, config)
+    
+    if config['kpis']['SM001']['enabled']:
+        results['SM001'] = calculate_sm001_major_incidents(None, config, incident_counts)
+    
+    if config['kpis']['SM002']['enabled']:
+        results['SM002/KR4'] = calculate_sm002_backlog(None, config, incident_counts)
+    
+    if config['kpis']['SM003']['enabled'] and requests_path is not None:
+        request_counts = _stream_request_counts(requests_path, config)
+        results['SM003/KR5'] = calculate_kr5_request_aging(None, config, request_counts)
+    
+    if config['kpis']['SM004']['enabled']:
+        results['SM004/KR6'] = calculate_sm004_fcr(None, config, incident_counts)
+    
+    results['OVERALL'] = calculate_overall_score(results, config)
+    
+    return results
+
+
+def _sum_chunk_counts(chunks, add_flags, cols: List[str]) -> Dict[str, int]:
+    """Transform each DataFrame chunk and accumulate its flag counts."""
+    totals: Dict[str, int] = {}
+    for chunk in chunks:
+        for key, value in _count_flags(add_flags(chunk), cols).items():
+            totals[key] = totals.get(key, 0) + value
+    return totals
+
+
+def calculate_all_chunked(incidents_path: str, requests_path: Optional[str],
+                          config: Dict[str, Any],
+                          chunk_rows: int = load_data.CHUNK_ROWS) -> Dict[str, Dict]:
+    """
+    Calculate all enabled KPIs reading the CSV files in DataFrame chunks.
+    
+    Each chunk goes through the normal preprocessing and transform steps, its
+    flag counts are accumulated and the chunk is discarded, so peak memory is
+    O(chunk_rows) regardless of the size of the export.
+    
+    Args:
+        incidents_path: Path to incidents CSV file
+        requests_path: Path to requests CSV file (None to skip SM003)
+        config: Configuration dictionary
+        chunk_rows: Maximum rows held in memory per chunk
+        
+    Returns:
+        Dictionary of all KPI results
+    """
+    results = {}
+    
+    incident_counts = _sum_chunk_counts(
+        load_data.iter_incident_chunks(incidents_path, config, chunk_rows),
+        lambda chunk: transform.add_incident_flags(chunk, config),
+        INCIDENT_FLAG_COLUMNS
+    )
+    
+    if config['kpis']['SM001']['enabled']:
+        results['SM001'] = calculate_sm001_major_incidents(None, config, incident_counts)
+    
+    if config['kpis']['SM002']['enabled']:
+        results['SM002/KR4'] = calculate_sm002_backlog(None, config, incident_counts)
+    
+    if config['kpis']['SM003']['enabled'] and requests_path is not None:
+        request_counts = _sum_chunk_counts(
+            load_data.iter_request_chunks(requests_path, config, chunk_rows),
+            lambda chunk: transform.add_request_flags(chunk, config),
+            ['Is_Aged']
+        )
+        results['SM003/KR5'] = calculate_kr5_request_aging(None, config, request_counts)
+    
+    if config['kpis']['SM004']['enabled']:
+        results['SM004/KR6'] = calculate_sm004_fcr(None, config, incident_counts)
+    
+    results['OVERALL'] = calculate_overall_score(results, config)
+    
+    return results
+
+
 if __name__ == "__main__":
     # Test KPI calculations
     import config_loader
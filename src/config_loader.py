@@ -3,10 +3,49 @@ Configuration loader for KPI pipeline.
 Loads and validates the YAML configuration file.
 """
 
+import copy
+import functools
 import yaml
 from pathlib import Path
 from typing import Dict, Any
 
+# Use the libyaml-backed C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+
+@functools.lru_cache(maxsize=8)
+def _load_yaml_cached(abspath: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Parse a YAML file, memoized on its resolved path and modification time.
+    
+    The mtime is part of the cache key so an edited file is re-parsed on the
+    next call. Callers must not mutate the returned object - use load_yaml.
+    """
+    with open(abspath, 'r') as f:
+        return yaml.load(f, Loader=_Loader)
+
+
+def load_yaml(path: str) -> Dict[str, Any]:
+    """
+    Load a YAML file, reusing the parsed result while the file is unchanged.
+    
+    Args:
+        path: Path to the YAML file
+        
+    Returns:
+        Parsed YAML data (a private copy the caller may modify)
+        
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        yaml.YAMLError: If the file is invalid
+    """
+    yaml_file = Path(path)
+    data = _load_yaml_cached(str(yaml_file.resolve()), yaml_file.stat().st_mtime_ns)
+    return copy.deepcopy(data)
+
 
 def load_config(config_path: str = "config/kpi_config.yaml") -> Dict[str, Any]:
     """
@@ -27,8 +66,7 @@ def load_config(config_path: str = "config/kpi_config.yaml") -> Dict[str, Any]:
     if not config_file.exists():
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
     
-    with open(config_file, 'r') as f:
-        config = yaml.safe_load(f)
+    config = load_yaml(config_file)
     
     # Validate required sections
     required_sections = ['column_mappings', 'thresholds', 'kpis']
@@ -0,0 +1,145 @@
+"""
+Display module for KPI pipeline.
+Formats KPI and OKR results as console text lines.
+"""
+
+from typing import Dict, Any, List
+
+# Console separator lines
+SEP_EQ = "=" * 70
+SEP_DASH = "-" * 70
+
+
+def format_major_incidents(kpi_data: Dict[str, Any]) -> List[str]:
+    """Detail lines for SM001 (major incidents)."""
+    return [
+        f"  P1: {kpi_data['P1_Count']} (target: ≤{kpi_data['P1_Target']})",
+        f"  P2: {kpi_data['P2_Count']} (target: ≤{kpi_data['P2_Target']})",
+        f"  Total Major: {kpi_data['Total_Major']}",
+    ]
+
+
+def format_backlog(kpi_data: Dict[str, Any]) -> List[str]:
+    """Detail lines for SM002/KR4 (incident backlog)."""
+    return [
+        f"  Total: {kpi_data['Total_Incidents']}",
+        f"  Backlog: {kpi_data['Backlog_Count']} ({kpi_data['Backlog_Percentage']}%)",
+        f"  Target: ≥{kpi_data['Target_Adherence']}% adherence",
+    ]
+
+
+def format_request_aging(kpi_data: Dict[str, Any]) -> List[str]:
+    """Detail lines for SM003/KR5 (request aging)."""
+    return [
+        f"  Total: {kpi_data['Total_Requests']}",
+        f"  Aged: {kpi_data['Aged_Count']} ({kpi_data['Aged_Percentage']}%)",
+        f"  Target: ≥{kpi_data['Target_Adherence']}% adherence",
+    ]
+
+
+def format_fcr(kpi_data: Dict[str, Any]) -> List[str]:
+    """Detail lines for SM004/KR6 (first call resolution)."""
+    return [
+        f"  Total Resolved: {kpi_data['Total_Resolved']}",
+        f"  FCR: {kpi_data['FCR_Count']} ({kpi_data['FCR_Percentage']}%)",
+        f"  Target: ≥{kpi_data['Target_Rate']}%",
+    ]
+
+
+# KPI detail formatters, keyed by a field unique to each KPI result
+KPI_FORMATTERS = {
+    'P1_Count': format_major_incidents,
+    'Backlog_Count': format_backlog,
+    'Aged_Count': format_request_aging,
+    'FCR_Count': format_fcr,
+}
+
+
+def format_kpi_results(kpi_results: Dict[str, Dict]) -> List[str]:
+    """
+    Format KPI results for console display.
+    
+    Args:
+        kpi_results: Dictionary of KPI results from calculate_kpis
+        
+    Returns:
+        List of output lines (without trailing newlines)
+    """
+    lines = []
+    lines.append("\n" + SEP_EQ)
+    lines.append("KPI RESULTS")
+    lines.append(SEP_EQ)
+    
+    for kpi_code, kpi_data in kpi_results.items():
+        if kpi_code == 'OVERALL':
+            lines.append(f"\n{SEP_EQ}")
+            lines.append(f"OVERALL PERFORMANCE")
+            lines.append(SEP_EQ)
+            lines.append(f"Score: {kpi_data['Overall_Score']}%")
+            lines.append(f"Status: {kpi_data['Overall_Status']}")
+            lines.append(f"Weights: {kpi_data['Weights_Used']}")
+        else:
+            lines.append(f"\n{kpi_code}: {kpi_data['KPI_Name']}")
+            lines.append(f"  Status: {kpi_data['Status']}")
+            lines.append(f"  Adherence: {kpi_data['Adherence_Rate']}%")
+            lines.append(f"  Business Impact: {kpi_data['Business_Impact']}")
+            
+            # KPI-specific details
+            for sentinel_key, formatter in KPI_FORMATTERS.items():
+                if sentinel_key in kpi_data:
+                    lines.extend(formatter(kpi_data))
+                    break
+    
+    return lines
+
+
+def format_okr_results(okr_results: Dict[str, Any],
+                       action_triggers: Dict[str, list]) -> List[str]:
+    """
+    Format OKR results and action triggers for console display.
+    
+    Args:
+        okr_results: Dictionary of OKR results from OKRCalculator
+        action_triggers: Dictionary of action triggers (critical/warning)
+        
+    Returns:
+        List of output lines (without trailing newlines)
+    """
+    lines = []
+    lines.append("\n" + SEP_EQ)
+    lines.append("OKR R002 RESULTS")
+    lines.append(SEP_EQ)
+    lines.append(f"\nObjective: {okr_results['objective']}")
+    lines.append(f"Overall Score: {okr_results['overall_score']}%")
+    lines.append(f"Status: {okr_results['overall_status']}")
+    lines.append(f"\nKey Results:")
+    lines.append(SEP_DASH)
+    
+    for kr_id in ['KR3', 'KR4', 'KR5', 'KR6']:
+        kr = okr_results['key_results'][kr_id]
+        lines.append(f"\n{kr_id}: {kr['name']}")
+        lines.append(f"  Score: {kr['score']}%")
+        lines.append(f"  Status: {kr['status']}")
+        lines.append(f"  Current: {kr['current_value']} {kr['target_operator']} {kr['target_value']} (target)")
+        lines.append(f"  Gap to Target: {kr['gap_to_target']}")
+        lines.append(f"  Owner: {kr['owner']}")
+    
+    # Action Triggers
+    if action_triggers['critical'] or action_triggers['warning']:
+        lines.append("\n" + SEP_EQ)
+        lines.append("ACTION TRIGGERS")
+        lines.append(SEP_EQ)
+        
+        if action_triggers['critical']:
+            lines.append("\n🔴 CRITICAL ACTIONS REQUIRED:")
+            for trigger in action_triggers['critical']:
+                lines.append(f"  {trigger['kr_id']}: {trigger['action']}")
+                lines.append(f"    → Escalate to: {trigger['escalation']}")
+        
+        if action_triggers['warning']:
+            lines.append("\n🟡 WARNING ACTIONS:")
+            for trigger in action_triggers['warning']:
+                lines.append(f"  {trigger['kr_id']}: {trigger['action']}")
+                lines.append(f"    → Escalate to: {trigger['escalation']}")
+    
+    return lines
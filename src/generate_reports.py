@@ -8,15 +8,67 @@ Author: KPI Pipeline Project
 Date: 2025-10-20
 """
 
+import io
+import os
 import pandas as pd
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 import openpyxl
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.utils.dataframe import dataframe_to_rows
+from openpyxl.utils import get_column_letter
 from openpyxl.chart import BarChart, PieChart, Reference
 
+# Shared cell styles - built once and reused for every cell instead of
+# constructing new style objects per cell
+HEADER_FONT = Font(bold=True, color='FFFFFF')
+BOLD_FONT = Font(bold=True)
+THIN_SIDE = Side(style='thin')
+THIN_BORDER = Border(left=THIN_SIDE, right=THIN_SIDE, top=THIN_SIDE, bottom=THIN_SIDE)
+CENTER = Alignment(horizontal='center')
+CENTER_MIDDLE = Alignment(horizontal='center', vertical='center')
+LEFT = Alignment(horizontal='left')
+DEFAULT_FILL = PatternFill(fill_type='solid', fgColor='CCCCCC')
+
+# Number formats - scores stay numeric in the workbook and Excel renders
+# the percent sign / decimals
+PCT_FORMAT = '0.0"%"'
+WHOLE_PCT_FORMAT = '0"%"'
+DECIMAL_FORMAT = '0.0'
+
+
+def _sm001_target_notes(kpi: Dict[str, Any]) -> Tuple[str, str]:
+    """Scorecard target and notes for SM001 (major incidents)."""
+    return (f"P1≤{kpi.get('P1_Target', 0)}, P2≤{kpi.get('P2_Target', 5)}",
+            f"P1={kpi.get('P1_Count', 0)}, P2={kpi.get('P2_Count', 0)}")
+
+
+def _backlog_target_notes(kpi: Dict[str, Any]) -> Tuple[str, str]:
+    """Scorecard target and notes for SM002/KR4 (incident backlog)."""
+    return (f"≥{kpi.get('Target_Adherence', 90)}%",
+            f"{kpi.get('Backlog_Count', 0)} backlog / {kpi.get('Total_Incidents', 0)} total")
+
+
+def _aging_target_notes(kpi: Dict[str, Any]) -> Tuple[str, str]:
+    """Scorecard target and notes for SM003/KR5 (request aging)."""
+    return (f"≥{kpi.get('Target_Adherence', 90)}%",
+            f"{kpi.get('Aged_Count', 0)} aged / {kpi.get('Total_Requests', 0)} total")
+
+
+def _fcr_target_notes(kpi: Dict[str, Any]) -> Tuple[str, str]:
+    """Scorecard target and notes for SM004/KR6 (first call resolution)."""
+    return (f"≥{kpi.get('Target_Rate', 80)}%",
+            f"{kpi.get('FCR_Count', 0)} FCR / {kpi.get('Total_Resolved', 0)} resolved")
+
+
+# KPI result key -> scorecard (target, notes) builder
+SCORECARD_TARGET_NOTES = {
+    'SM001': _sm001_target_notes,
+    'SM002/KR4': _backlog_target_notes,
+    'SM003/KR5': _aging_target_notes,
+    'SM004/KR6': _fcr_target_notes,
+}
+
 
 class ReportGenerator:
     """
@@ -48,6 +100,23 @@ class ReportGenerator:
         'SUBHEADER': '70AD47', # Green
     }
     
+    # Solid fills for each color above, keyed the same way
+    FILLS = {
+        name: PatternFill(fill_type='solid', fgColor=color)
+        for name, color in COLORS.items()
+    }
+    
+    # KPI result keys in report order (OVERALL is reported separately)
+    KPI_CODES = ('SM001', 'SM002/KR4', 'SM003/KR5', 'SM004/KR6')
+    
+    # OKR status emoji (first character of e.g. '🟠 AT RISK') -> COLORS key
+    OKR_STATUS_EMOJI = {
+        '🟢': 'EXCELLENT',
+        '🟡': 'GOOD',
+        '🟠': 'WARNING',
+        '🔴': 'CRITICAL',
+    }
+    
     def __init__(self, config):
         """
         Initialize report generator with configuration.
@@ -57,13 +126,97 @@ class ReportGenerator:
         """
         self.config = config
     
+    def _kpi_items(self, kpi_results: Dict[str, Any]) -> List[tuple]:
+        """
+        Get the (code, result) pairs of the KPIs present, in report order.
+        
+        Args:
+            kpi_results: Dictionary with all KPI results
+            
+        Returns:
+            List of (kpi_code, kpi_result) tuples, excluding OVERALL
+        """
+        return [(code, kpi_results[code]) for code in self.KPI_CODES if code in kpi_results]
+    
+    def _okr_status_fill(self, okr_status: str) -> PatternFill:
+        """
+        Get the fill for an OKR status such as '🟢 EXCELLENT'.
+        
+        The leading status emoji is looked up directly; statuses without one
+        fall back to their plain name.
+        
+        Args:
+            okr_status: OKR status string
+            
+        Returns:
+            Solid PatternFill for the status (grey if unknown)
+        """
+        key = self.OKR_STATUS_EMOJI.get(okr_status[:1], okr_status)
+        return self.FILLS.get(key, DEFAULT_FILL)
+    
+    def _write_header_row(self,
+                          ws,
+                          row: int,
+                          headers: List[str],
+                          alignment: Optional[Alignment] = None,
+                          border: Optional[Border] = None,
+                          start_column: int = 1) -> None:
+        """
+        Write a table header row in the shared subheader style.
+        
+        Args:
+            ws: Worksheet to write to
+            row: Row number of the header
+            headers: Header labels
+            alignment: Optional alignment applied to each header cell
+            border: Optional border applied to each header cell
+            start_column: Column of the first header label (default: A)
+        """
+        fill = self.FILLS['SUBHEADER']
+        for col, header in enumerate(headers, start=start_column):
+            cell = ws.cell(row=row, column=col, value=header)
+            cell.font = HEADER_FONT
+            cell.fill = fill
+            if alignment is not None:
+                cell.alignment = alignment
+            if border is not None:
+                cell.border = border
+    
+    @staticmethod
+    def _save_workbook(wb: openpyxl.Workbook, output_path: str) -> None:
+        """
+        Save a workbook in one write, replacing output_path atomically.
+        
+        The workbook is serialized into memory, written to a temporary file
+        next to the target and moved into place with os.replace, so a failed
+        save never leaves a truncated report at output_path.
+        
+        Args:
+            wb: Workbook to save
+            output_path: Destination .xlsx path
+        """
+        buffer = io.BytesIO()
+        wb.save(buffer)
+        
+        tmp_path = f"{output_path}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(buffer.getbuffer())
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+    
     def generate_excel_report(self,
                             kpi_results: Dict[str, Any],
                             okr_results: Dict[str, Any],
                             action_triggers: Dict[str, list],
                             incidents: pd.DataFrame,
-                            requests: pd.DataFrame,
-                            output_path: str) -> None:
+                            requests: Optional[pd.DataFrame],
+                            output_path: str,
+                            generated_at: Optional[datetime] = None,
+                            include_raw_sheets: bool = False) -> bool:
         """
         Generate complete Excel dashboard with all KPI and OKR results.
         
@@ -74,18 +227,33 @@ class ReportGenerator:
         - OKR Summary
         - Key Results Detail
         - Action Items
+        - Incident/Request Details (only with include_raw_sheets)
         
         Args:
             kpi_results: Dictionary of KPI results from calculate_kpis
             okr_results: Dictionary of OKR results from OKRCalculator
             action_triggers: Dictionary of action triggers (critical/warning)
             incidents: Transformed incidents DataFrame
-            requests: Transformed requests DataFrame
+            requests: Transformed requests DataFrame (None if SM003 disabled)
             output_path: Path where Excel file should be saved
+            generated_at: Report timestamp (default: now); pass the same
+                datetime used for a timestamped filename to keep them in sync
+            include_raw_sheets: Append the raw incident/request data sheets
+                (off by default for executive reporting)
+            
+        Returns:
+            True if the report was written; False (nothing written) if there
+            are no incident or request rows, or no KPI and OKR results
             
         Raises:
             Exception: If report generation fails
         """
+        # Nothing to report - skip building and saving an empty workbook
+        no_data = incidents.empty and (requests is None or requests.empty)
+        no_results = not any(code != 'OVERALL' for code in kpi_results) and not okr_results
+        if no_data or no_results:
+            return False
+        
         try:
             # Create output directory if needed
             Path(output_path).parent.mkdir(parents=True, exist_ok=True)
@@ -95,18 +263,19 @@ class ReportGenerator:
             wb.remove(wb.active)  # Remove default sheet
             
             # Create sheets in order
-            self._create_executive_summary_sheet(wb, kpi_results, okr_results)
+            self._create_executive_summary_sheet(wb, kpi_results, okr_results,
+                                                 generated_at or datetime.now())
             self._create_scorecard_sheet(wb, kpi_results)
             self._create_kpi_detail_sheets(wb, kpi_results, incidents, requests)
             self._create_okr_summary_sheet(wb, okr_results)
             self._create_key_results_detail_sheet(wb, okr_results)
             self._create_action_items_sheet(wb, action_triggers, okr_results)
-            # Note: Raw data sheets omitted for executive reporting
-            # Operational analysis module will include detailed data sheets
+            if include_raw_sheets:
+                self._create_data_sheets(wb, incidents, requests)
             
             # Save workbook
-            wb.save(output_path)
-            print(f"✅ Report saved: {output_path}")
+            self._save_workbook(wb, output_path)
+            return True
             
         except Exception as e:
             raise Exception(f"Failed to generate Excel report: {str(e)}")
@@ -114,7 +283,8 @@ class ReportGenerator:
     def _create_executive_summary_sheet(self, 
                                        workbook: openpyxl.Workbook,
                                        kpi_results: Dict[str, Any],
-                                       okr_results: Dict[str, Any]) -> None:
+                                       okr_results: Dict[str, Any],
+                                       generated_at: datetime) -> None:
         """
         Create executive summary sheet with overall KPI and OKR scorecard.
         
@@ -129,22 +299,22 @@ class ReportGenerator:
             workbook: openpyxl Workbook object
             kpi_results: Dictionary with all KPI results including OVERALL
             okr_results: Dictionary with OKR R002 results
+            generated_at: Report timestamp shown under the title
         """
         ws = workbook.create_sheet("Executive Summary", 0)
         
         # Title
-        ws['A1'] = 'KPI EXECUTIVE SUMMARY'
-        ws['A1'].font = Font(size=20, bold=True, color='FFFFFF')
-        ws['A1'].fill = PatternFill(start_color=self.COLORS['HEADER'],
-                                     end_color=self.COLORS['HEADER'],
-                                     fill_type='solid')
-        ws['A1'].alignment = Alignment(horizontal='center', vertical='center')
+        cell = ws.cell(row=1, column=1, value='KPI EXECUTIVE SUMMARY')
+        cell.font = Font(size=20, bold=True, color='FFFFFF')
+        cell.fill = self.FILLS['HEADER']
+        cell.alignment = CENTER_MIDDLE
         ws.merge_cells('A1:E1')
         ws.row_dimensions[1].height = 30
         
         # Timestamp
-        ws['A2'] = f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-        ws['A2'].font = Font(size=10, italic=True)
+        cell = ws.cell(row=2, column=1,
+                       value=f"Generated: {generated_at.strftime('%Y-%m-%d %H:%M:%S')}")
+        cell.font = Font(size=10, italic=True)
         ws.merge_cells('A2:E2')
         
         # Overall Score (large display)
@@ -152,124 +322,76 @@ class ReportGenerator:
         score = overall.get('Overall_Score', 0)
         status = overall.get('Overall_Status', 'UNKNOWN')
         
-        ws['A4'] = 'Overall Score'
-        ws['A4'].font = Font(size=14, bold=True)
+        ws.cell(row=4, column=1, value='Overall Score').font = Font(size=14, bold=True)
         
-        ws['A5'] = f"{score:.1f}%"
-        ws['A5'].font = Font(size=48, bold=True, color='FFFFFF')
-        ws['A5'].fill = PatternFill(start_color=self.COLORS.get(status, 'CCCCCC'),
-                                     end_color=self.COLORS.get(status, 'CCCCCC'),
-                                     fill_type='solid')
-        ws['A5'].alignment = Alignment(horizontal='center', vertical='center')
+        cell = ws.cell(row=5, column=1, value=score)
+        cell.number_format = PCT_FORMAT
+        cell.font = Font(size=48, bold=True, color='FFFFFF')
+        cell.fill = self.FILLS.get(status, DEFAULT_FILL)
+        cell.alignment = CENTER_MIDDLE
         ws.row_dimensions[5].height = 60
         
-        ws['A6'] = status
-        ws['A6'].font = Font(size=16, bold=True)
-        ws['A6'].alignment = Alignment(horizontal='center')
+        cell = ws.cell(row=6, column=1, value=status)
+        cell.font = Font(size=16, bold=True)
+        cell.alignment = CENTER
         
-        # Key Metrics Table
-        ws['C4'] = 'Key Metrics'
-        ws['C4'].font = Font(size=14, bold=True)
+        # Key Metrics Table (header at C5, one row per KPI below it)
+        ws.cell(row=4, column=3, value='Key Metrics').font = Font(size=14, bold=True)
         
-        metrics_data = [
-            ['KPI', 'Status', 'Score'],
-        ]
+        header_row = 5
+        self._write_header_row(ws, header_row, ['KPI', 'Status', 'Score'],
+                               alignment=CENTER, border=THIN_BORDER, start_column=3)
         
-        # Add each KPI
-        for kpi_code in ['SM001', 'SM002/KR4', 'SM003/KR5', 'SM004/KR6']:
-            if kpi_code in kpi_results:
-                kpi = kpi_results[kpi_code]
-                metrics_data.append([
-                    kpi.get('KPI_Name', kpi_code),
-                    kpi.get('Status', ''),
-                    f"{kpi.get('Adherence_Rate', 0):.1f}%"
-                ])
-        
-        # Write metrics table
-        row = 5
-        for data_row in metrics_data:
+        for row, (kpi_code, kpi) in enumerate(self._kpi_items(kpi_results), start=header_row + 1):
+            kpi_status = kpi.get('Status', '')
+            data_row = [kpi.get('KPI_Name', kpi_code), kpi_status, kpi.get('Adherence_Rate', 0)]
             for col, value in enumerate(data_row, start=3):  # Start at column C
                 cell = ws.cell(row=row, column=col, value=value)
-                if row == 5:  # Header row
-                    cell.font = Font(bold=True, color='FFFFFF')
-                    cell.fill = PatternFill(start_color=self.COLORS['SUBHEADER'],
-                                          end_color=self.COLORS['SUBHEADER'],
-                                          fill_type='solid')
-                elif col == 4:  # Status column
-                    status = data_row[1]
-                    if status in self.COLORS:
-                        cell.fill = PatternFill(start_color=self.COLORS[status],
-                                              end_color=self.COLORS[status],
-                                              fill_type='solid')
-                cell.border = Border(
-                    left=Side(style='thin'),
-                    right=Side(style='thin'),
-                    top=Side(style='thin'),
-                    bottom=Side(style='thin')
-                )
-                cell.alignment = Alignment(horizontal='center')
-            row += 1
+                cell.border = THIN_BORDER
+                cell.alignment = CENTER
+            status_fill = self.FILLS.get(kpi_status)
+            if status_fill is not None:
+                ws.cell(row=row, column=4).fill = status_fill
+            ws.cell(row=row, column=5).number_format = PCT_FORMAT
         
         # Weighted Breakdown
-        ws['A9'] = 'Weighted Breakdown'
-        ws['A9'].font = Font(size=14, bold=True)
+        ws.cell(row=9, column=1, value='Weighted Breakdown').font = Font(size=14, bold=True)
         
-        breakdown_data = [
-            ['KPI', 'Score', 'Weight', 'Contribution'],
-        ]
+        header_row = 10
+        self._write_header_row(ws, header_row, ['KPI', 'Score', 'Weight', 'Contribution'],
+                               alignment=CENTER, border=THIN_BORDER)
         
-        weights_used = overall.get('Weights_Used', {})
-        
-        for kpi_code, weight in weights_used.items():
-            if kpi_code in kpi_results:
-                kpi = kpi_results[kpi_code]
-                score = kpi.get('Adherence_Rate', 0)
-                contribution = score * weight / 100
-                breakdown_data.append([
-                    kpi_code,
-                    f"{score:.1f}%",
-                    f"{weight}%",
-                    f"{contribution:.1f}"
-                ])
-        
-        # Write breakdown table
-        row = 10
-        for data_row in breakdown_data:
-            for col, value in enumerate(data_row, start=1):
+        breakdown_formats = [None, PCT_FORMAT, WHOLE_PCT_FORMAT, DECIMAL_FORMAT]
+        row = header_row + 1
+        for kpi_code, weight in overall.get('Weights_Used', {}).items():
+            kpi = kpi_results.get(kpi_code)
+            if kpi is None:
+                continue
+            score = kpi.get('Adherence_Rate', 0)
+            data_row = [kpi_code, score, weight, round(score * weight / 100, 1)]
+            for col, (value, number_format) in enumerate(zip(data_row, breakdown_formats), start=1):
                 cell = ws.cell(row=row, column=col, value=value)
-                if row == 10:  # Header row
-                    cell.font = Font(bold=True, color='FFFFFF')
-                    cell.fill = PatternFill(start_color=self.COLORS['SUBHEADER'],
-                                          end_color=self.COLORS['SUBHEADER'],
-                                          fill_type='solid')
-                cell.border = Border(
-                    left=Side(style='thin'),
-                    right=Side(style='thin'),
-                    top=Side(style='thin'),
-                    bottom=Side(style='thin')
-                )
-                cell.alignment = Alignment(horizontal='center')
+                if number_format:
+                    cell.number_format = number_format
+                cell.border = THIN_BORDER
+                cell.alignment = CENTER
             row += 1
         
         # Add OKR Score display (right side of executive summary)
-        ws['G4'] = 'OKR R002 Score'
-        ws['G4'].font = Font(size=14, bold=True)
+        ws.cell(row=4, column=7, value='OKR R002 Score').font = Font(size=14, bold=True)
         
         okr_score = okr_results.get('overall_score', 0)
         okr_status = okr_results.get('overall_status', 'UNKNOWN')
         
-        ws['G5'] = f"{okr_score:.1f}%"
-        ws['G5'].font = Font(size=48, bold=True, color='FFFFFF')
-        # Strip emoji from status for color lookup
-        status_clean = okr_status.split()[-1] if ' ' in okr_status else okr_status
-        ws['G5'].fill = PatternFill(start_color=self.COLORS.get(status_clean, 'CCCCCC'),
-                                     end_color=self.COLORS.get(status_clean, 'CCCCCC'),
-                                     fill_type='solid')
-        ws['G5'].alignment = Alignment(horizontal='center', vertical='center')
+        cell = ws.cell(row=5, column=7, value=okr_score)
+        cell.number_format = PCT_FORMAT
+        cell.font = Font(size=48, bold=True, color='FFFFFF')
+        cell.fill = self._okr_status_fill(okr_status)
+        cell.alignment = CENTER_MIDDLE
         
-        ws['G6'] = okr_status
-        ws['G6'].font = Font(size=14, bold=True)
-        ws['G6'].alignment = Alignment(horizontal='center')
+        cell = ws.cell(row=6, column=7, value=okr_status)
+        cell.font = Font(size=14, bold=True)
+        cell.alignment = CENTER
         
         # Auto-fit columns
         for col in ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H']:
@@ -290,59 +412,27 @@ class ReportGenerator:
         # Title
         ws['A1'] = 'KPI SCORECARD'
         ws['A1'].font = Font(size=16, bold=True, color='FFFFFF')
-        ws['A1'].fill = PatternFill(start_color=self.COLORS['HEADER'],
-                                     end_color=self.COLORS['HEADER'],
-                                     fill_type='solid')
-        ws['A1'].alignment = Alignment(horizontal='center', vertical='center')
+        ws['A1'].fill = self.FILLS['HEADER']
+        ws['A1'].alignment = CENTER_MIDDLE
         ws.merge_cells('A1:F1')
         ws.row_dimensions[1].height = 25
         
         # Headers
         headers = ['KPI Code', 'KPI Name', 'Status', 'Score', 'Target', 'Notes']
-        for col, header in enumerate(headers, start=1):
-            cell = ws.cell(row=3, column=col, value=header)
-            cell.font = Font(bold=True, color='FFFFFF')
-            cell.fill = PatternFill(start_color=self.COLORS['SUBHEADER'],
-                                   end_color=self.COLORS['SUBHEADER'],
-                                   fill_type='solid')
-            cell.alignment = Alignment(horizontal='center')
-            cell.border = Border(
-                left=Side(style='thin'),
-                right=Side(style='thin'),
-                top=Side(style='thin'),
-                bottom=Side(style='thin')
-            )
+        self._write_header_row(ws, 3, headers, alignment=CENTER, border=THIN_BORDER)
         
         # Data rows
         row = 4
-        for kpi_code in ['SM001', 'SM002/KR4', 'SM003/KR5', 'SM004/KR6']:
-            if kpi_code not in kpi_results:
-                continue
-                
-            kpi = kpi_results[kpi_code]
-            
+        for kpi_code, kpi in self._kpi_items(kpi_results):
             # Determine target and notes based on KPI type
-            if kpi_code == 'SM001':
-                target = f"P1≤{kpi.get('P1_Target', 0)}, P2≤{kpi.get('P2_Target', 5)}"
-                notes = f"P1={kpi.get('P1_Count', 0)}, P2={kpi.get('P2_Count', 0)}"
-            elif kpi_code in ['SM002/KR4', 'SM003/KR5']:
-                target = f"≥{kpi.get('Target_Adherence', 90)}%"
-                if 'Backlog_Count' in kpi:
-                    notes = f"{kpi.get('Backlog_Count', 0)} backlog / {kpi.get('Total_Incidents', 0)} total"
-                else:
-                    notes = f"{kpi.get('Aged_Count', 0)} aged / {kpi.get('Total_Requests', 0)} total"
-            elif kpi_code == 'SM004/KR6':
-                target = f"≥{kpi.get('Target_Rate', 80)}%"
-                notes = f"{kpi.get('FCR_Count', 0)} FCR / {kpi.get('Total_Resolved', 0)} resolved"
-            else:
-                target = ""
-                notes = ""
+            target_notes = SCORECARD_TARGET_NOTES.get(kpi_code)
+            target, notes = target_notes(kpi) if target_notes else ("", "")
             
             data = [
                 kpi_code,
                 kpi.get('KPI_Name', ''),
                 kpi.get('Status', ''),
-                f"{kpi.get('Adherence_Rate', 0):.1f}%",
+                kpi.get('Adherence_Rate', 0),
                 target,
                 notes
             ]
@@ -352,19 +442,14 @@ class ReportGenerator:
                 
                 # Color code status column
                 if col == 3:  # Status column
-                    status = data[2]
-                    if status in self.COLORS:
-                        cell.fill = PatternFill(start_color=self.COLORS[status],
-                                              end_color=self.COLORS[status],
-                                              fill_type='solid')
+                    status_fill = self.FILLS.get(value)
+                    if status_fill is not None:
+                        cell.fill = status_fill
+                elif col == 4:  # Score column
+                    cell.number_format = PCT_FORMAT
                 
-                cell.border = Border(
-                    left=Side(style='thin'),
-                    right=Side(style='thin'),
-                    top=Side(style='thin'),
-                    bottom=Side(style='thin')
-                )
-                cell.alignment = Alignment(horizontal='left' if col in [2, 6] else 'center')
+                cell.border = THIN_BORDER
+                cell.alignment = LEFT if col in [2, 6] else CENTER
             
             row += 1
         
@@ -380,7 +465,7 @@ class ReportGenerator:
                                  workbook: openpyxl.Workbook,
                                  kpi_results: Dict[str, Any],
                                  incidents: pd.DataFrame,
-                                 requests: pd.DataFrame) -> None:
+                                 requests: Optional[pd.DataFrame]) -> None:
         """
         Create individual detail sheets for each KPI.
         
@@ -411,16 +496,6 @@ class ReportGenerator:
                            sm001: Dict[str, Any],
                            incidents: pd.DataFrame) -> None:
         """Create SM001 detail sheet"""
-        ws = workbook.create_sheet("SM001 - Major Incidents")
-        
-        # Title
-        ws['A1'] = 'SM001 - MAJOR INCIDENTS (P1 & P2)'
-        ws['A1'].font = Font(size=14, bold=True, color='FFFFFF')
-        ws['A1'].fill = PatternFill(start_color=self.COLORS['HEADER'],
-                                     end_color=self.COLORS['HEADER'],
-                                     fill_type='solid')
-        ws.merge_cells('A1:D1')
-        
         # Summary metrics
         metrics = [
             ['Metric', 'Count', 'Target', 'Status'],
@@ -431,43 +506,15 @@ class ReportGenerator:
             ['Total Major', sm001.get('Total_Major', 0), f"≤{sm001.get('P2_Target', 5)}", 
              sm001.get('Status', '')],
         ]
-        
-        for row_idx, row_data in enumerate(metrics, start=3):
-            for col_idx, value in enumerate(row_data, start=1):
-                cell = ws.cell(row=row_idx, column=col_idx, value=value)
-                if row_idx == 3:  # Header
-                    cell.font = Font(bold=True, color='FFFFFF')
-                    cell.fill = PatternFill(start_color=self.COLORS['SUBHEADER'],
-                                          end_color=self.COLORS['SUBHEADER'],
-                                          fill_type='solid')
-                elif col_idx == 4:  # Status column
-                    if value in self.COLORS:
-                        cell.fill = PatternFill(start_color=self.COLORS[value],
-                                              end_color=self.COLORS[value],
-                                              fill_type='solid')
-                cell.border = Border(left=Side(style='thin'), right=Side(style='thin'),
-                                   top=Side(style='thin'), bottom=Side(style='thin'))
-                cell.alignment = Alignment(horizontal='center')
-        
-        # Column widths
-        for col in ['A', 'B', 'C', 'D']:
-            ws.column_dimensions[col].width = 20
+        self._render_metric_sheet(workbook, "SM001 - Major Incidents",
+                                  'SM001 - MAJOR INCIDENTS (P1 & P2)', metrics,
+                                  col_width=20, pct_column=False)
     
     def _create_sm002_sheet(self,
                            workbook: openpyxl.Workbook,
                            sm002: Dict[str, Any],
                            incidents: pd.DataFrame) -> None:
         """Create SM002 backlog detail sheet"""
-        ws = workbook.create_sheet("SM002 - Backlog Analysis")
-        
-        # Title
-        ws['A1'] = 'SM002 - SERVICENOW BACKLOG (KR4)'
-        ws['A1'].font = Font(size=14, bold=True, color='FFFFFF')
-        ws['A1'].fill = PatternFill(start_color=self.COLORS['HEADER'],
-                                     end_color=self.COLORS['HEADER'],
-                                     fill_type='solid')
-        ws.merge_cells('A1:D1')
-        
         # Summary metrics
         total = sm002.get('Total_Incidents', 0)
         backlog = sm002.get('Backlog_Count', 0)
@@ -477,53 +524,23 @@ class ReportGenerator:
         
         metrics = [
             ['Metric', 'Count', 'Percentage', 'Status'],
-            ['Total Incidents', total, '100.0%', ''],
-            ['Non-Backlog (<10 days)', non_backlog, f'{100-adherence:.1f}%', 
+            ['Total Incidents', total, 100.0, ''],
+            ['Non-Backlog (<10 days)', non_backlog, round(100-adherence, 1), 
              'PASS' if adherence <= (100-target) else 'FAIL'],
-            ['Backlog (≥10 days)', backlog, f'{adherence:.1f}%', 
+            ['Backlog (≥10 days)', backlog, adherence, 
              'FAIL' if backlog > 0 else 'PASS'],
             ['', '', '', ''],
-            ['Adherence Rate', '', f'{100-adherence:.1f}%', sm002.get('Status', '')],
+            ['Adherence Rate', '', round(100-adherence, 1), sm002.get('Status', '')],
             ['Target', '', f'≥{target}%', ''],
         ]
-        
-        for row_idx, row_data in enumerate(metrics, start=3):
-            for col_idx, value in enumerate(row_data, start=1):
-                cell = ws.cell(row=row_idx, column=col_idx, value=value)
-                if row_idx == 3:  # Header
-                    cell.font = Font(bold=True, color='FFFFFF')
-                    cell.fill = PatternFill(start_color=self.COLORS['SUBHEADER'],
-                                          end_color=self.COLORS['SUBHEADER'],
-                                          fill_type='solid')
-                elif row_idx in [8, 9]:  # Summary rows
-                    cell.font = Font(bold=True)
-                elif col_idx == 4 and value in self.COLORS:  # Status
-                    cell.fill = PatternFill(start_color=self.COLORS[value],
-                                          end_color=self.COLORS[value],
-                                          fill_type='solid')
-                cell.border = Border(left=Side(style='thin'), right=Side(style='thin'),
-                                   top=Side(style='thin'), bottom=Side(style='thin'))
-                cell.alignment = Alignment(horizontal='center')
-        
-        # Column widths
-        for col in ['A', 'B', 'C', 'D']:
-            ws.column_dimensions[col].width = 25
+        self._render_metric_sheet(workbook, "SM002 - Backlog Analysis",
+                                  'SM002 - SERVICENOW BACKLOG (KR4)', metrics)
     
     def _create_kr5_sheet(self,
                          workbook: openpyxl.Workbook,
                          kr5: Dict[str, Any],
-                         requests: pd.DataFrame) -> None:
+                         requests: Optional[pd.DataFrame]) -> None:
         """Create KR5 request aging detail sheet"""
-        ws = workbook.create_sheet("SM004 - Request Aging")
-        
-        # Title
-        ws['A1'] = 'SM003 - SERVICE REQUEST AGING (KR5)'
-        ws['A1'].font = Font(size=14, bold=True, color='FFFFFF')
-        ws['A1'].fill = PatternFill(start_color=self.COLORS['HEADER'],
-                                     end_color=self.COLORS['HEADER'],
-                                     fill_type='solid')
-        ws.merge_cells('A1:D1')
-        
         # Summary metrics
         total = kr5.get('Total_Requests', 0)
         aged = kr5.get('Aged_Count', 0)
@@ -533,53 +550,23 @@ class ReportGenerator:
         
         metrics = [
             ['Metric', 'Count', 'Percentage', 'Status'],
-            ['Total Requests', total, '100.0%', ''],
-            ['Non-Aged (<30 days)', non_aged, f'{100-adherence:.1f}%', 
+            ['Total Requests', total, 100.0, ''],
+            ['Non-Aged (<30 days)', non_aged, round(100-adherence, 1), 
              'PASS' if adherence <= (100-target) else 'FAIL'],
-            ['Aged (≥30 days)', aged, f'{adherence:.1f}%', 
+            ['Aged (≥30 days)', aged, adherence, 
              'FAIL' if aged > 0 else 'PASS'],
             ['', '', '', ''],
-            ['Adherence Rate', '', f'{100-adherence:.1f}%', kr5.get('Status', '')],
+            ['Adherence Rate', '', round(100-adherence, 1), kr5.get('Status', '')],
             ['Target', '', f'≥{target}%', ''],
         ]
-        
-        for row_idx, row_data in enumerate(metrics, start=3):
-            for col_idx, value in enumerate(row_data, start=1):
-                cell = ws.cell(row=row_idx, column=col_idx, value=value)
-                if row_idx == 3:  # Header
-                    cell.font = Font(bold=True, color='FFFFFF')
-                    cell.fill = PatternFill(start_color=self.COLORS['SUBHEADER'],
-                                          end_color=self.COLORS['SUBHEADER'],
-                                          fill_type='solid')
-                elif row_idx in [8, 9]:  # Summary rows
-                    cell.font = Font(bold=True)
-                elif col_idx == 4 and value in self.COLORS:  # Status
-                    cell.fill = PatternFill(start_color=self.COLORS[value],
-                                          end_color=self.COLORS[value],
-                                          fill_type='solid')
-                cell.border = Border(left=Side(style='thin'), right=Side(style='thin'),
-                                   top=Side(style='thin'), bottom=Side(style='thin'))
-                cell.alignment = Alignment(horizontal='center')
-        
-        # Column widths
-        for col in ['A', 'B', 'C', 'D']:
-            ws.column_dimensions[col].width = 25
+        self._render_metric_sheet(workbook, "SM004 - Request Aging",
+                                  'SM003 - SERVICE REQUEST AGING (KR5)', metrics)
     
     def _create_sm004_sheet(self,
                            workbook: openpyxl.Workbook,
                            sm004: Dict[str, Any],
                            incidents: pd.DataFrame) -> None:
         """Create SM004 first time fix detail sheet"""
-        ws = workbook.create_sheet("SM004 - First Time Fix")
-        
-        # Title
-        ws['A1'] = 'SM004 - FIRST TIME FIX RATE (KR6)'
-        ws['A1'].font = Font(size=14, bold=True, color='FFFFFF')
-        ws['A1'].fill = PatternFill(start_color=self.COLORS['HEADER'],
-                                     end_color=self.COLORS['HEADER'],
-                                     fill_type='solid')
-        ws.merge_cells('A1:D1')
-        
         # Summary metrics
         total_resolved = sm004.get('Total_Resolved', 0)
         fcr_count = sm004.get('FCR_Count', 0)
@@ -588,125 +575,141 @@ class ReportGenerator:
         
         metrics = [
             ['Metric', 'Count', 'Percentage', 'Status'],
-            ['Total Resolved', total_resolved, '100.0%', ''],
-            ['First Call Resolution', fcr_count, f'{fcr_rate:.1f}%', 
+            ['Total Resolved', total_resolved, 100.0, ''],
+            ['First Call Resolution', fcr_count, fcr_rate, 
              'PASS' if fcr_rate >= target else 'FAIL'],
-            ['Reassigned', total_resolved - fcr_count, f'{100-fcr_rate:.1f}%', 
+            ['Reassigned', total_resolved - fcr_count, round(100-fcr_rate, 1), 
              'FAIL' if fcr_rate < target else ''],
             ['', '', '', ''],
-            ['FCR Rate', '', f'{fcr_rate:.1f}%', sm004.get('Status', '')],
+            ['FCR Rate', '', fcr_rate, sm004.get('Status', '')],
             ['Target', '', f'≥{target}%', ''],
         ]
+        self._render_metric_sheet(workbook, "SM004 - First Time Fix",
+                                  'SM004 - FIRST TIME FIX RATE (KR6)', metrics)
+    
+    def _render_metric_sheet(self,
+                             workbook: openpyxl.Workbook,
+                             sheet_name: str,
+                             title: str,
+                             metrics: List[list],
+                             col_width: int = 25,
+                             pct_column: bool = True) -> None:
+        """
+        Render a KPI detail sheet from a metrics table.
+        
+        The first metrics row is the header (written at row 3). Rows after a
+        blank spacer row are summary rows and are shown in bold; other rows
+        get a status fill in column D.
+        
+        Args:
+            workbook: openpyxl Workbook object
+            sheet_name: Name of the new sheet
+            title: Title shown in the merged A1:D1 banner
+            metrics: Table rows of [metric, count, value, status]
+            col_width: Width of columns A-D
+            pct_column: Format column C of the data rows as a percentage
+        """
+        ws = workbook.create_sheet(sheet_name)
+        
+        # Title
+        cell = ws.cell(row=1, column=1, value=title)
+        cell.font = Font(size=14, bold=True, color='FFFFFF')
+        cell.fill = self.FILLS['HEADER']
+        ws.merge_cells('A1:D1')
         
-        for row_idx, row_data in enumerate(metrics, start=3):
+        self._write_header_row(ws, 3, metrics[0], alignment=CENTER, border=THIN_BORDER)
+        
+        summary = False
+        for row_idx, row_data in enumerate(metrics[1:], start=4):
+            blank = not any(row_data)
+            if blank:  # Spacer - summary rows follow
+                summary = True
             for col_idx, value in enumerate(row_data, start=1):
                 cell = ws.cell(row=row_idx, column=col_idx, value=value)
-                if row_idx == 3:  # Header
-                    cell.font = Font(bold=True, color='FFFFFF')
-                    cell.fill = PatternFill(start_color=self.COLORS['SUBHEADER'],
-                                          end_color=self.COLORS['SUBHEADER'],
-                                          fill_type='solid')
-                elif row_idx in [8, 9]:  # Summary rows
-                    cell.font = Font(bold=True)
-                elif col_idx == 4 and value in self.COLORS:  # Status
-                    cell.fill = PatternFill(start_color=self.COLORS[value],
-                                          end_color=self.COLORS[value],
-                                          fill_type='solid')
-                cell.border = Border(left=Side(style='thin'), right=Side(style='thin'),
-                                   top=Side(style='thin'), bottom=Side(style='thin'))
-                cell.alignment = Alignment(horizontal='center')
+                if summary and not blank:
+                    cell.font = BOLD_FONT
+                elif col_idx == 4:  # Status
+                    status_fill = self.FILLS.get(value)
+                    if status_fill is not None:
+                        cell.fill = status_fill
+                if pct_column and col_idx == 3:
+                    cell.number_format = PCT_FORMAT
+                cell.border = THIN_BORDER
+                cell.alignment = CENTER
         
         # Column widths
         for col in ['A', 'B', 'C', 'D']:
-            ws.column_dimensions[col].width = 25
+            ws.column_dimensions[col].width = col_width
     
     def _create_data_sheets(self,
                           workbook: openpyxl.Workbook,
                           incidents: pd.DataFrame,
-                          requests: pd.DataFrame) -> None:
+                          requests: Optional[pd.DataFrame]) -> None:
         """
         Create raw data sheets for incidents and requests.
         
+        A sheet is only added for a DataFrame that has rows.
+        
         Args:
             workbook: openpyxl Workbook object
             incidents: Incidents DataFrame with calculated fields
             requests: Requests DataFrame with calculated fields
         """
-        # Incident Details sheet
-        ws_incidents = workbook.create_sheet("Incident Details")
-        
-        # Select key columns for incident details
-        incident_cols = ['number', 'priority', 'incident_state', 'opened_at', 
-                        'u_resolved', 'reassignment_count', 'location',
-                        'Priority_Number', 'Is_Major_Incident', 'Is_Backlog', 'Is_First_Call_Resolution']
-        
-        available_incident_cols = [col for col in incident_cols if col in incidents.columns]
-        incident_data = incidents[available_incident_cols].copy()
-        
-        # Write incident data
-        for r_idx, row in enumerate(dataframe_to_rows(incident_data, index=False, header=True), 1):
-            for c_idx, value in enumerate(row, 1):
-                cell = ws_incidents.cell(row=r_idx, column=c_idx, value=value)
-                if r_idx == 1:  # Header row
-                    cell.font = Font(bold=True, color='FFFFFF')
-                    cell.fill = PatternFill(start_color=self.COLORS['SUBHEADER'],
-                                          end_color=self.COLORS['SUBHEADER'],
-                                          fill_type='solid')
-                    cell.alignment = Alignment(horizontal='center')
-        
-        # Auto-fit columns
-        for col in ws_incidents.columns:
-            max_length = 0
-            column = col[0].column_letter
-            for cell in col:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 50)
-            ws_incidents.column_dimensions[column].width = adjusted_width
-        
-        # Freeze header row
-        ws_incidents.freeze_panes = 'A2'
+        # Incident Details sheet (only if incident data exists)
+        if incidents is not None and not incidents.empty:
+            # Select key columns for incident details
+            incident_cols = ['number', 'priority', 'incident_state', 'opened_at', 
+                            'u_resolved', 'reassignment_count', 'location',
+                            'Priority_Number', 'Is_Major_Incident', 'Is_Backlog', 'Is_First_Call_Resolution']
+            
+            available_incident_cols = [col for col in incident_cols if col in incidents.columns]
+            incident_data = incidents[available_incident_cols]
+            self._write_data_sheet(workbook, "Incident Details", incident_data)
         
         # Request Details sheet (only if requests data exists)
-        if not requests.empty:
-            ws_requests = workbook.create_sheet("Request Details")
-            
+        if requests is not None and not requests.empty:
             # Select key columns for request details
             request_cols = ['number', 'opened_at', 'closed_at', 'state',
                            'assignment_group', 'Is_Aged']
             
             available_request_cols = [col for col in request_cols if col in requests.columns]
-            request_data = requests[available_request_cols].copy()
-            
-            # Write request data
-            for r_idx, row in enumerate(dataframe_to_rows(request_data, index=False, header=True), 1):
-                for c_idx, value in enumerate(row, 1):
-                    cell = ws_requests.cell(row=r_idx, column=c_idx, value=value)
-                    if r_idx == 1:  # Header row
-                        cell.font = Font(bold=True, color='FFFFFF')
-                        cell.fill = PatternFill(start_color=self.COLORS['SUBHEADER'],
-                                              end_color=self.COLORS['SUBHEADER'],
-                                              fill_type='solid')
-                        cell.alignment = Alignment(horizontal='center')
-            
-            # Auto-fit columns
-            for col in ws_requests.columns:
-                max_length = 0
-                column = col[0].column_letter
-                for cell in col:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)
-                ws_requests.column_dimensions[column].width = adjusted_width
-            
-            # Freeze header row
-            ws_requests.freeze_panes = 'A2'
+            request_data = requests[available_request_cols]
+            self._write_data_sheet(workbook, "Request Details", request_data)
+    
+    def _write_data_sheet(self,
+                          workbook: openpyxl.Workbook,
+                          title: str,
+                          data: pd.DataFrame) -> None:
+        """
+        Write a DataFrame to a new sheet with a styled, frozen header row.
+        
+        Data rows are added with ws.append, one call per row, rather than
+        one ws.cell call per value. Only the header is styled: data cells get
+        no borders or fills, so they all share the default style and
+        styles.xml stays the same size however many rows are written.
+        
+        Args:
+            workbook: openpyxl Workbook object
+            title: Sheet name
+            data: DataFrame to write (columns become the header row)
+        """
+        ws = workbook.create_sheet(title)
+        
+        # Write header and data rows
+        self._write_header_row(ws, 1, list(data.columns), alignment=CENTER)
+        for row in data.itertuples(index=False, name=None):
+            ws.append(row)
+        
+        # Auto-fit columns from the longest value (missing values are
+        # measured as 'None', matching the cell text length used before)
+        text = data.astype(str).mask(data.isna(), 'None')
+        for col_idx, (header, values) in enumerate(text.items(), start=1):
+            longest = int(values.str.len().max()) if len(values) else 0
+            max_length = max(len(str(header)), longest)
+            ws.column_dimensions[get_column_letter(col_idx)].width = min(max_length + 2, 50)
+        
+        # Freeze header row
+        ws.freeze_panes = 'A2'
 
 
     def _create_okr_summary_sheet(self,
@@ -718,26 +721,25 @@ class ReportGenerator:
         # Title
         ws['A1'] = 'OKR R002 - SERVICE DELIVERY EXCELLENCE'
         ws['A1'].font = Font(size=16, bold=True, color='FFFFFF')
-        ws['A1'].fill = PatternFill(start_color=self.COLORS['HEADER'],
-                                     end_color=self.COLORS['HEADER'],
-                                     fill_type='solid')
+        ws['A1'].fill = self.FILLS['HEADER']
         ws.merge_cells('A1:E1')
         ws.row_dimensions[1].height = 25
         
         # Objective
         ws['A3'] = 'Objective:'
-        ws['A3'].font = Font(bold=True)
+        ws['A3'].font = BOLD_FONT
         ws['B3'] = okr_results.get('objective', '')
         ws.merge_cells('B3:E3')
         
         # Overall Score
         ws['A5'] = 'Overall OKR Score'
         ws['A5'].font = Font(size=14, bold=True)
-        ws['B5'] = f"{okr_results.get('overall_score', 0):.1f}%"
+        ws['B5'] = okr_results.get('overall_score', 0)
+        ws['B5'].number_format = PCT_FORMAT
         ws['B5'].font = Font(size=18, bold=True)
         
         ws['A6'] = 'Status'
-        ws['A6'].font = Font(bold=True)
+        ws['A6'].font = BOLD_FONT
         ws['B6'] = okr_results.get('overall_status', '')
         ws['B6'].font = Font(size=14, bold=True)
         
@@ -746,13 +748,7 @@ class ReportGenerator:
         ws['A9'].font = Font(size=14, bold=True)
         
         headers = ['KR ID', 'Name', 'Score', 'Status', 'Current', 'Target', 'Gap']
-        for col, header in enumerate(headers, start=1):
-            cell = ws.cell(row=10, column=col, value=header)
-            cell.font = Font(bold=True, color='FFFFFF')
-            cell.fill = PatternFill(start_color=self.COLORS['SUBHEADER'],
-                                   end_color=self.COLORS['SUBHEADER'],
-                                   fill_type='solid')
-            cell.alignment = Alignment(horizontal='center')
+        self._write_header_row(ws, 10, headers, alignment=CENTER)
         
         # Add Key Results data
         row = 11
@@ -761,18 +757,21 @@ class ReportGenerator:
             data = [
                 kr_id,
                 kr['name'],
-                f"{kr['score']:.1f}%",
+                kr['score'],
                 kr['status'],
-                f"{kr['current_value']:.1f}",
+                kr['current_value'],
                 f"{kr['target_operator']} {kr['target_value']}",
-                f"{kr['gap_to_target']:.1f}"
+                kr['gap_to_target']
             ]
             
             for col, value in enumerate(data, start=1):
                 cell = ws.cell(row=row, column=col, value=value)
-                cell.border = Border(left=Side(style='thin'), right=Side(style='thin'),
-                                   top=Side(style='thin'), bottom=Side(style='thin'))
-                cell.alignment = Alignment(horizontal='center' if col != 2 else 'left')
+                if col == 3:
+                    cell.number_format = PCT_FORMAT
+                elif col in (5, 7):
+                    cell.number_format = DECIMAL_FORMAT
+                cell.border = THIN_BORDER
+                cell.alignment = CENTER if col != 2 else LEFT
             row += 1
         
         # Auto-fit columns
@@ -789,9 +788,7 @@ class ReportGenerator:
         # Title
         ws['A1'] = 'KEY RESULTS DETAIL'
         ws['A1'].font = Font(size=16, bold=True, color='FFFFFF')
-        ws['A1'].fill = PatternFill(start_color=self.COLORS['HEADER'],
-                                     end_color=self.COLORS['HEADER'],
-                                     fill_type='solid')
+        ws['A1'].fill = self.FILLS['HEADER']
         ws.merge_cells('A1:E1')
         
         row = 3
@@ -799,12 +796,10 @@ class ReportGenerator:
             kr = okr_results['key_results'][kr_id]
             
             # KR Header
-            ws[f'A{row}'] = f"{kr_id}: {kr['name']}"
-            ws[f'A{row}'].font = Font(size=12, bold=True, color='FFFFFF')
-            ws[f'A{row}'].fill = PatternFill(start_color=self.COLORS['SUBHEADER'],
-                                            end_color=self.COLORS['SUBHEADER'],
-                                            fill_type='solid')
-            ws.merge_cells(f'A{row}:E{row}')
+            cell = ws.cell(row=row, column=1, value=f"{kr_id}: {kr['name']}")
+            cell.font = Font(size=12, bold=True, color='FFFFFF')
+            cell.fill = self.FILLS['SUBHEADER']
+            ws.merge_cells(start_row=row, start_column=1, end_row=row, end_column=5)
             row += 1
             
             # KR Details
@@ -822,10 +817,9 @@ class ReportGenerator:
             ]
             
             for label, value in details:
-                ws[f'A{row}'] = label
-                ws[f'A{row}'].font = Font(bold=True)
-                ws[f'B{row}'] = value
-                ws.merge_cells(f'B{row}:E{row}')
+                ws.cell(row=row, column=1, value=label).font = BOLD_FONT
+                ws.cell(row=row, column=2, value=value)
+                ws.merge_cells(start_row=row, start_column=2, end_row=row, end_column=5)
                 row += 1
             
             row += 1  # Blank row between KRs
@@ -838,36 +832,30 @@ class ReportGenerator:
                                    workbook: openpyxl.Workbook,
                                    action_triggers: Dict[str, list],
                                    okr_results: Dict[str, Any]) -> None:
-        """Create Action Items sheet"""
+        """Create Action Items sheet (omitted when there are no action triggers)"""
+        if not action_triggers['critical'] and not action_triggers['warning']:
+            return
+        
         ws = workbook.create_sheet("Action Items")
         
         # Title
         ws['A1'] = 'ACTION ITEMS & ESCALATIONS'
         ws['A1'].font = Font(size=16, bold=True, color='FFFFFF')
-        ws['A1'].fill = PatternFill(start_color=self.COLORS['HEADER'],
-                                     end_color=self.COLORS['HEADER'],
-                                     fill_type='solid')
+        ws['A1'].fill = self.FILLS['HEADER']
         ws.merge_cells('A1:E1')
         
         # Critical Actions
         row = 3
         if action_triggers['critical']:
-            ws[f'A{row}'] = '🔴 CRITICAL ACTIONS REQUIRED'
-            ws[f'A{row}'].font = Font(size=14, bold=True)
-            ws[f'A{row}'].fill = PatternFill(start_color=self.COLORS['CRITICAL'],
-                                            end_color=self.COLORS['CRITICAL'],
-                                            fill_type='solid')
-            ws.merge_cells(f'A{row}:E{row}')
+            cell = ws.cell(row=row, column=1, value='🔴 CRITICAL ACTIONS REQUIRED')
+            cell.font = Font(size=14, bold=True)
+            cell.fill = self.FILLS['CRITICAL']
+            ws.merge_cells(start_row=row, start_column=1, end_row=row, end_column=5)
             row += 1
             
             # Headers
             headers = ['KR ID', 'Action Required', 'Escalate To', 'Priority']
-            for col, header in enumerate(headers, start=1):
-                cell = ws.cell(row=row, column=col, value=header)
-                cell.font = Font(bold=True, color='FFFFFF')
-                cell.fill = PatternFill(start_color=self.COLORS['SUBHEADER'],
-                                       end_color=self.COLORS['SUBHEADER'],
-                                       fill_type='solid')
+            self._write_header_row(ws, row, headers)
             row += 1
             
             # Critical action rows
@@ -880,30 +868,22 @@ class ReportGenerator:
                 ]
                 for col, value in enumerate(data, start=1):
                     cell = ws.cell(row=row, column=col, value=value)
-                    cell.border = Border(left=Side(style='thin'), right=Side(style='thin'),
-                                       top=Side(style='thin'), bottom=Side(style='thin'))
+                    cell.border = THIN_BORDER
                 row += 1
             
             row += 1  # Blank row
         
         # Warning Actions
         if action_triggers['warning']:
-            ws[f'A{row}'] = '🟡 WARNING ACTIONS'
-            ws[f'A{row}'].font = Font(size=14, bold=True)
-            ws[f'A{row}'].fill = PatternFill(start_color=self.COLORS['WARNING'],
-                                            end_color=self.COLORS['WARNING'],
-                                            fill_type='solid')
-            ws.merge_cells(f'A{row}:E{row}')
+            cell = ws.cell(row=row, column=1, value='🟡 WARNING ACTIONS')
+            cell.font = Font(size=14, bold=True)
+            cell.fill = self.FILLS['WARNING']
+            ws.merge_cells(start_row=row, start_column=1, end_row=row, end_column=5)
             row += 1
             
             # Headers
             headers = ['KR ID', 'Action Required', 'Escalate To', 'Priority']
-            for col, header in enumerate(headers, start=1):
-                cell = ws.cell(row=row, column=col, value=header)
-                cell.font = Font(bold=True, color='FFFFFF')
-                cell.fill = PatternFill(start_color=self.COLORS['SUBHEADER'],
-                                       end_color=self.COLORS['SUBHEADER'],
-                                       fill_type='solid')
+            self._write_header_row(ws, row, headers)
             row += 1
             
             # Warning action rows
@@ -916,8 +896,7 @@ class ReportGenerator:
                 ]
                 for col, value in enumerate(data, start=1):
                     cell = ws.cell(row=row, column=col, value=value)
-                    cell.border = Border(left=Side(style='thin'), right=Side(style='thin'),
-                                       top=Side(style='thin'), bottom=Side(style='thin'))
+                    cell.border = THIN_BORDER
                 row += 1
         
         # Auto-fit columns
@@ -931,9 +910,11 @@ def generate_excel_report(kpi_results: Dict[str, Any],
                           okr_results: Dict[str, Any],
                           action_triggers: Dict[str, list],
                           incidents: pd.DataFrame,
-                          requests: pd.DataFrame,
+                          requests: Optional[pd.DataFrame],
                           config,
-                          output_path: str) -> None:
+                          output_path: str,
+                          generated_at: Optional[datetime] = None,
+                          include_raw_sheets: bool = False) -> bool:
     """
     Convenience function to generate Excel report.
     
@@ -942,10 +923,17 @@ def generate_excel_report(kpi_results: Dict[str, Any],
         okr_results: Dictionary of OKR results
         action_triggers: Dictionary of action triggers
         incidents: Transformed incidents DataFrame
-        requests: Transformed requests DataFrame
+        requests: Transformed requests DataFrame (None if SM003 disabled)
         config: Configuration object
         output_path: Path for output file
+        generated_at: Report timestamp (default: now)
+        include_raw_sheets: Append the raw incident/request data sheets
+        
+    Returns:
+        True if the report was written, False if there was nothing to report
+        (see ReportGenerator.generate_excel_report)
     """
     generator = ReportGenerator(config)
-    generator.generate_excel_report(kpi_results, okr_results, action_triggers, 
-                                   incidents, requests, output_path)
\ No newline at end of file
+    return generator.generate_excel_report(kpi_results, okr_results, action_triggers, 
+                                   incidents, requests, output_path,
+                                   generated_at, include_raw_sheets)
\ No newline at end of file
@@ -3,11 +3,43 @@ Data loading module for KPI pipeline.
 Loads and preprocesses incident and request CSV files.
 """
 
+import glob
+import hashlib
+import os
 import pandas as pd
 import re
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, Optional
 from pathlib import Path
 
+# PyArrow is optional - used for multi-threaded CSV parsing when installed
+try:
+    import pyarrow
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Hex digits of the source and version hashes in cache file names
+# (<stem>-<source>-<version>.arrow)
+CACHE_SOURCE_LENGTH = 8
+CACHE_KEY_LENGTH = 16
+
+# Rows per chunk when reading CSVs with iter_incident_chunks/iter_request_chunks
+CHUNK_ROWS = 200_000
+
+# Raw CSV columns (and parser dtypes) needed to calculate the incident KPIs
+INCIDENT_KPI_COLUMNS = {
+    'priority', 'opened_at', 'u_resolved', 'resolved_at',
+    'reassignment_count', 'contact_type'
+}
+INCIDENT_KPI_DTYPES = {
+    'priority': str,
+    'opened_at': str,
+    'u_resolved': str,
+    'resolved_at': str,
+    'reassignment_count': 'float64',
+    'contact_type': str,
+}
+
 
 def extract_priority_number(priority_str: str, fallback: int = 99) -> int:
     """
@@ -37,31 +69,129 @@ def extract_priority_number(priority_str: str, fallback: int = 99) -> int:
     return fallback
 
 
-def load_incidents(filepath: str, config: Dict[str, Any]) -> pd.DataFrame:
+def get_cache_path(filepath: str, cache_dir: str, use_pyarrow: bool = False) -> Path:
     """
-    Load and preprocess incident data from CSV.
+    Build the Arrow cache path for a CSV file.
+    
+    Entries are named <stem>-<source>-<version>.arrow. The source hash covers
+    the file's absolute path and the parsing engine, so same-named files in
+    different directories (and the two engines) never share or evict each
+    other's entries. The version hash covers the modification time and size,
+    so any change to the source CSV produces a new cache entry.
     
     Args:
-        filepath: Path to incidents CSV file
-        config: Configuration dictionary
+        filepath: Path to source CSV file
+        cache_dir: Directory holding cached Arrow files
+        use_pyarrow: Whether the entry holds PyArrow-engine output
         
     Returns:
-        DataFrame with preprocessed incident data
+        Path of the Arrow (Feather) cache file
+    """
+    stat = os.stat(filepath)
+    engine = 'pyarrow' if use_pyarrow else 'c'
+    source = f"{os.path.abspath(filepath)}:{engine}"
+    version = f"{source}:{stat.st_mtime_ns}:{stat.st_size}"
+    source_key = hashlib.blake2b(source.encode()).hexdigest()[:CACHE_SOURCE_LENGTH]
+    cache_key = hashlib.blake2b(version.encode()).hexdigest()[:CACHE_KEY_LENGTH]
+    return Path(cache_dir) / f"{Path(filepath).stem}-{source_key}-{cache_key}.arrow"
+
+
+def _write_cache(df: pd.DataFrame, cache_path: Path) -> None:
+    """
+    Write an Arrow cache entry atomically and evict stale entries.
+    
+    The frame is written to a temporary file and moved into place with
+    os.replace, so an interrupted write never leaves a truncated file under a
+    valid cache key. Other entries for the same source are then removed.
+    
+    Args:
+        df: Raw DataFrame to cache
+        cache_path: Destination from get_cache_path
+    """
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+    try:
+        df.to_feather(tmp_path, compression='zstd')
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        if tmp_path.exists():
+            tmp_path.unlink()
+        raise
+    
+    # Evict older versions of the same source (<stem>-<source>-<version>.arrow)
+    prefix = cache_path.stem.rsplit('-', 1)[0]
+    pattern = f"{glob.escape(prefix)}-{'?' * CACHE_KEY_LENGTH}.arrow"
+    for stale in cache_path.parent.glob(pattern):
+        if stale != cache_path:
+            stale.unlink(missing_ok=True)
+
+
+def read_csv(filepath: str, use_pyarrow: bool = False,
+             cache_dir: Optional[str] = None) -> pd.DataFrame:
+    """
+    Read a CSV file, using the PyArrow engine when requested and available.
+    
+    The PyArrow engine tokenizes in parallel threads and returns Arrow-backed
+    columns, which avoids allocating a Python str object per string cell.
+    Falls back to the default pandas C engine if PyArrow is not installed.
+    
+    If cache_dir is given (and PyArrow is installed), the raw parsed data is
+    stored as an Arrow IPC (Feather) sidecar on first read and loaded from it on later
+    runs, skipping CSV tokenization entirely while the source is unchanged.
+    Arrow IPC keeps the exact column types and entries are kept per engine,
+    so cached reads return the same dtypes as the first (uncached) read. The
+    cache is only a speed-up: if it cannot be written, the parsed frame is
+    returned as usual.
+    
+    Args:
+        filepath: Path to CSV file
+        use_pyarrow: Parse with the PyArrow engine if available
+        cache_dir: Optional directory for the Arrow cache
         
-    Raises:
-        FileNotFoundError: If CSV file doesn't exist
+    Returns:
+        Raw DataFrame as read from the CSV file
     """
-    # Check file exists
-    if not Path(filepath).exists():
-        raise FileNotFoundError(f"Incidents file not found: {filepath}")
+    use_pyarrow = use_pyarrow and PYARROW_AVAILABLE
     
-    # Load CSV
-    df = pd.read_csv(filepath)
-    print(f"Loaded {len(df)} incidents from {filepath}")
+    cache_path = None
+    if cache_dir and PYARROW_AVAILABLE:
+        cache_path = get_cache_path(filepath, cache_dir, use_pyarrow)
+        if cache_path.exists():
+            if use_pyarrow:
+                return pd.read_feather(cache_path, dtype_backend='pyarrow')
+            return pd.read_feather(cache_path)
+    
+    if use_pyarrow:
+        df = pd.read_csv(filepath, engine='pyarrow', dtype_backend='pyarrow')
+    if not use_pyarrow or df.empty:
+        # A header-only file gives null-typed Arrow columns, which the
+        # transforms cannot compare against strings - use the C engine
+        df = pd.read_csv(filepath)
+    
+    # Header-only files are cheap to re-read and are not cached (see above)
+    if cache_path is not None and not df.empty:
+        try:
+            _write_cache(df, cache_path)
+        except (OSError, ValueError, pyarrow.ArrowException) as e:
+            print(f"  ℹ CSV cache not written for {Path(filepath).name}: {e}")
     
-    # Get column mappings
-    col_map = config['column_mappings']
+    return df
+
+
+def preprocess_incidents(df: pd.DataFrame, config: Dict[str, Any],
+                         current_time: Optional[pd.Timestamp] = None) -> pd.DataFrame:
+    """
+    Standardize raw incident data (column names, dates, priority, ages).
     
+    Args:
+        df: Raw incident DataFrame as read from CSV
+        config: Configuration dictionary
+        current_time: Reference time for Days_Open (default: now)
+        
+    Returns:
+        DataFrame with preprocessed incident data
+    """
     # Rename columns to standardized names
     rename_map = {}
     if 'u_resolved' in df.columns:
@@ -96,38 +226,65 @@ def load_incidents(filepath: str, config: Dict[str, Any]) -> pd.DataFrame:
     
     # Calculate days open (for all incidents)
     if 'opened_at' in df.columns:
-        current_time = pd.Timestamp.now()
+        if current_time is None:
+            current_time = pd.Timestamp.now()
         df['Days_Open'] = (current_time - df['opened_at']).dt.total_seconds() / 86400
     
-    print(f"✓ Parsed {sum(df.columns.str.contains('_at'))} date columns")
-    print(f"✓ Extracted priority numbers (range: {df['Priority_Number'].min()}-{df['Priority_Number'].max()})")
-    print(f"✓ Filled {df['reassignment_count'].isna().sum()} null reassignment counts")
-    
     return df
 
 
-def load_requests(filepath: str, config: Dict[str, Any]) -> pd.DataFrame:
+def load_incidents(filepath: str, config: Dict[str, Any],
+                   use_pyarrow: bool = False,
+                   cache_dir: Optional[str] = None,
+                   verbose: bool = True) -> pd.DataFrame:
     """
-    Load and preprocess request data from CSV.
+    Load and preprocess incident data from CSV.
     
     Args:
-        filepath: Path to requests CSV file
+        filepath: Path to incidents CSV file
         config: Configuration dictionary
+        use_pyarrow: Parse with the PyArrow engine if available
+        cache_dir: Optional directory for an Arrow cache of the raw CSV
+        verbose: Print loading progress (disable when loading concurrently)
         
     Returns:
-        DataFrame with preprocessed request data
+        DataFrame with preprocessed incident data
         
     Raises:
         FileNotFoundError: If CSV file doesn't exist
     """
     # Check file exists
     if not Path(filepath).exists():
-        raise FileNotFoundError(f"Requests file not found: {filepath}")
+        raise FileNotFoundError(f"Incidents file not found: {filepath}")
     
     # Load CSV
-    df = pd.read_csv(filepath)
-    print(f"Loaded {len(df)} requests from {filepath}")
+    df = read_csv(filepath, use_pyarrow, cache_dir)
+    if verbose:
+        print(f"Loaded {len(df)} incidents from {filepath}")
+    
+    df = preprocess_incidents(df, config)
     
+    if verbose:
+        print(f"✓ Parsed {sum(df.columns.str.contains('_at'))} date columns")
+        print(f"✓ Extracted priority numbers (range: {df['Priority_Number'].min()}-{df['Priority_Number'].max()})")
+        print(f"✓ Filled {df['reassignment_count'].isna().sum()} null reassignment counts")
+    
+    return df
+
+
+def preprocess_requests(df: pd.DataFrame, config: Dict[str, Any],
+                        current_time: Optional[pd.Timestamp] = None) -> pd.DataFrame:
+    """
+    Standardize raw request data (column names, dates, ages).
+    
+    Args:
+        df: Raw request DataFrame as read from CSV
+        config: Configuration dictionary
+        current_time: Reference time for Days_Open (default: now)
+        
+    Returns:
+        DataFrame with preprocessed request data
+    """
     # Get column mappings from config
     col_map = config.get('column_mappings', {})
     
@@ -139,7 +296,6 @@ def load_requests(filepath: str, config: Dict[str, Any]) -> pd.DataFrame:
     
     if rename_map:
         df = df.rename(columns=rename_map)
-        print(f"✓ Applied {len(rename_map)} column mappings")
     
     # Parse date columns
     date_columns = ['opened_at', 'closed_at', 'due_date', 'expected_start', 'sys_created_on']
@@ -149,7 +305,8 @@ def load_requests(filepath: str, config: Dict[str, Any]) -> pd.DataFrame:
     
     # Calculate days open
     if 'opened_at' in df.columns:
-        current_time = pd.Timestamp.now()
+        if current_time is None:
+            current_time = pd.Timestamp.now()
         df['Days_Open'] = (current_time - df['opened_at']).dt.total_seconds() / 86400
     
     # Calculate days to close (for closed requests)
@@ -164,7 +321,117 @@ def load_requests(filepath: str, config: Dict[str, Any]) -> pd.DataFrame:
     if rename_map:
         df = df.rename(columns=rename_map)
     
-    print(f"✓ Parsed {sum(df.columns.str.contains('_at|date'))} date columns")
+    return df
+
+
+def iter_incident_chunks(filepath: str, config: Dict[str, Any],
+                         chunk_rows: int = CHUNK_ROWS) -> Iterator[pd.DataFrame]:
+    """
+    Read and preprocess incidents in chunks of at most chunk_rows rows.
+    
+    Only the columns needed for the KPI calculations are parsed, with explicit
+    dtypes, so peak memory is bounded by one chunk rather than the whole file.
+    
+    Args:
+        filepath: Path to incidents CSV file
+        config: Configuration dictionary
+        chunk_rows: Maximum rows per chunk
+        
+    Yields:
+        Preprocessed incident DataFrame chunks
+        
+    Raises:
+        FileNotFoundError: If CSV file doesn't exist
+    """
+    if not Path(filepath).exists():
+        raise FileNotFoundError(f"Incidents file not found: {filepath}")
+    
+    current_time = pd.Timestamp.now()
+    reader = pd.read_csv(
+        filepath,
+        chunksize=chunk_rows,
+        usecols=lambda col: col in INCIDENT_KPI_COLUMNS,
+        dtype=INCIDENT_KPI_DTYPES
+    )
+    with reader:
+        for chunk in reader:
+            yield preprocess_incidents(chunk, config, current_time)
+
+
+def iter_request_chunks(filepath: str, config: Dict[str, Any],
+                        chunk_rows: int = CHUNK_ROWS) -> Iterator[pd.DataFrame]:
+    """
+    Read and preprocess requests in chunks of at most chunk_rows rows.
+    
+    Args:
+        filepath: Path to requests CSV file
+        config: Configuration dictionary
+        chunk_rows: Maximum rows per chunk
+        
+    Yields:
+        Preprocessed request DataFrame chunks
+        
+    Raises:
+        FileNotFoundError: If CSV file doesn't exist
+    """
+    if not Path(filepath).exists():
+        raise FileNotFoundError(f"Requests file not found: {filepath}")
+    
+    # Opened and closed dates, under either their standard or mapped names
+    col_map = config.get('column_mappings', {})
+    usecols = {'opened_at', 'closed_at', col_map.get('opened_at'), col_map.get('closed_at')}
+    
+    current_time = pd.Timestamp.now()
+    reader = pd.read_csv(
+        filepath,
+        chunksize=chunk_rows,
+        usecols=lambda col: col in usecols,
+        dtype=str
+    )
+    with reader:
+        for chunk in reader:
+            yield preprocess_requests(chunk, config, current_time)
+
+
+def load_requests(filepath: str, config: Dict[str, Any],
+                  use_pyarrow: bool = False,
+                  cache_dir: Optional[str] = None,
+                  verbose: bool = True) -> pd.DataFrame:
+    """
+    Load and preprocess request data from CSV.
+    
+    Args:
+        filepath: Path to requests CSV file
+        config: Configuration dictionary
+        use_pyarrow: Parse with the PyArrow engine if available
+        cache_dir: Optional directory for an Arrow cache of the raw CSV
+        verbose: Print loading progress (disable when loading concurrently)
+        
+    Returns:
+        DataFrame with preprocessed request data
+        
+    Raises:
+        FileNotFoundError: If CSV file doesn't exist
+    """
+    # Check file exists
+    if not Path(filepath).exists():
+        raise FileNotFoundError(f"Requests file not found: {filepath}")
+    
+    # Load CSV
+    df = read_csv(filepath, use_pyarrow, cache_dir)
+    if verbose:
+        print(f"Loaded {len(df)} requests from {filepath}")
+    
+    # Columns renamed by the config column mappings
+    col_map = config.get('column_mappings', {})
+    mapped = {actual for actual in col_map.values() if actual in df.columns}
+    
+    df = preprocess_requests(df, config)
+    
+    if verbose:
+        if mapped:
+            print(f"✓ Applied {len(mapped)} column mappings")
+        print(f"✓ Parsed {sum(df.columns.str.contains('_at|date'))} date columns")
     
     return df
 
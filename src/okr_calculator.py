@@ -17,6 +17,12 @@ from datetime import datetime
 from typing import Dict, Any, Optional
 import logging
 
+# Handle both relative and absolute imports
+try:
+    from .config_loader import load_yaml
+except ImportError:
+    from config_loader import load_yaml
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -52,8 +58,7 @@ class OKRCalculator:
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """Load OKR configuration from YAML file."""
         try:
-            with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
+            config = load_yaml(config_path)
             logger.info(f"Loaded OKR config: {config['metadata']['okr_name']}")
             return config
         except FileNotFoundError:
@@ -330,16 +335,21 @@ class OKRCalculator:
         # Fallback to critical if no band matched
         return bands['critical']['status']
     
-    def get_action_triggers(self) -> Dict[str, list]:
+    def get_action_triggers(self, okr_result: Optional[Dict[str, Any]] = None) -> Dict[str, list]:
         """
         Identify triggered actions based on current OKR performance.
         
+        Args:
+            okr_result: Result of calculate_overall_okr() to reuse; calculated
+                if not provided
+        
         Returns:
             Dictionary of triggered actions by KR:
                 - 'critical': Actions requiring immediate attention
                 - 'warning': Actions requiring monitoring
         """
-        okr_result = self.calculate_overall_okr()
+        if okr_result is None:
+            okr_result = self.calculate_overall_okr()
         kr_results = okr_result['key_results']
         
         triggers = {
@@ -504,7 +514,7 @@ def main():
     print(okr_calc.generate_summary_report())
     
     # Get action triggers
-    triggers = okr_calc.get_action_triggers()
+    triggers = okr_calc.get_action_triggers(okr_result)
     
     if triggers['critical']:
         print("\n🔴 CRITICAL ACTIONS REQUIRED:")
@@ -15,12 +15,11 @@ import json
 from datetime import datetime
 from pathlib import Path
 import sys
-import io
 
 # Fix Windows console encoding for Unicode characters
 if sys.platform == 'win32':
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.stderr.reconfigure(encoding='utf-8')
 
 # Import pipeline modules
 try:
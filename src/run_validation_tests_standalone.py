@@ -20,12 +20,11 @@ from datetime import datetime
 from pathlib import Path
 import sys
 import os
-import io
 
 # Fix Windows console encoding for Unicode characters
 if sys.platform == 'win32':
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.stderr.reconfigure(encoding='utf-8')
 
 # Add src directory to path for imports
 script_dir = os.path.dirname(os.path.abspath(__file__))
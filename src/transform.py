@@ -3,8 +3,38 @@ Transform module for KPI pipeline.
 Adds calculated fields to incident and request data.
 """
 
+import numpy as np
 import pandas as pd
-from typing import Dict, Any
+from typing import Dict, Any, List
+
+# Flag columns emitted (and cast to bool) by add_incident_flags / add_request_flags
+INCIDENT_FLAGS_TO_CAST = [
+    'Is_Major_Incident',
+    'Is_Backlog',
+    'Is_First_Time_Fix',
+    'Is_First_Call_Resolution',
+    'Is_Resolved',
+    'Is_P1',
+    'Is_P2',
+]
+REQUEST_FLAGS_TO_CAST = ['Is_Aged', 'Is_Closed']
+
+
+def _as_bool_flags(df: pd.DataFrame, cols: List[str]) -> None:
+    """
+    Cast flag columns to NumPy bool in place.
+    
+    Comparisons on nullable or Arrow-backed columns yield 'boolean' /
+    'bool[pyarrow]' dtypes with missing values; missing is treated as False,
+    matching the NaN comparison semantics of NumPy-backed data.
+    
+    Args:
+        df: DataFrame holding the flag columns
+        cols: Flag column names
+    """
+    for col in cols:
+        if df[col].dtype != np.bool_:
+            df[col] = df[col].fillna(False).astype(np.bool_)
 
 
 def add_incident_flags(df: pd.DataFrame, config: Dict[str, Any]) -> pd.DataFrame:
@@ -16,6 +46,9 @@ def add_incident_flags(df: pd.DataFrame, config: Dict[str, Any]) -> pd.DataFrame
         - Is_Backlog: Incident aged beyond threshold
         - Is_First_Time_Fix: Zero reassignments
         - Is_First_Call_Resolution: Zero reassignments AND excluded contact types
+        - Is_Resolved, Is_P1, Is_P2
+        
+    All flags are returned as NumPy bool columns.
         
     Args:
         df: Incident DataFrame
@@ -58,6 +91,9 @@ def add_incident_flags(df: pd.DataFrame, config: Dict[str, Any]) -> pd.DataFrame
     df['Is_P1'] = df['Priority_Number'] == 1
     df['Is_P2'] = df['Priority_Number'] == 2
     
+    # Contract: every flag is a NumPy bool column (counted via np.count_nonzero)
+    _as_bool_flags(df, INCIDENT_FLAGS_TO_CAST)
+    
     return df
 
 
@@ -69,6 +105,8 @@ def add_request_flags(df: pd.DataFrame, config: Dict[str, Any]) -> pd.DataFrame:
         - Is_Aged: Request aged beyond threshold
         - Is_Closed: Request is closed
         
+    All flags are returned as NumPy bool columns.
+        
     Args:
         df: Request DataFrame
         config: Configuration dictionary
@@ -88,6 +126,9 @@ def add_request_flags(df: pd.DataFrame, config: Dict[str, Any]) -> pd.DataFrame:
     # Flag: Closed
     df['Is_Closed'] = df['closed_at'].notna()
     
+    # Contract: every flag is a NumPy bool column (counted via np.count_nonzero)
+    _as_bool_flags(df, REQUEST_FLAGS_TO_CAST)
+    
     return df
 
 
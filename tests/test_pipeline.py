@@ -12,6 +12,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src import config_loader, load_data, transform, calculate_kpis
 import pandas as pd
+import pytest
 
 
 def test_config_loading():
@@ -205,6 +206,112 @@ Note: Compare your results with these baselines to ensure accuracy.
     return True
 
 
+def test_kpi_weights_follow_config_edits():
+    """Weights must reflect in-place edits to the same config object."""
+    config = config_loader.load_config('config/kpi_config.yaml')
+    config['kpis']['SM003']['enabled'] = True
+    assert 'SM003' in config_loader.get_kpi_weights(config)
+    
+    config['kpis']['SM003']['enabled'] = False
+    weights = config_loader.get_kpi_weights(config)
+    assert 'SM003' not in weights
+    assert sum(weights.values()) == 100
+
+
+# Sample CSVs used by the parity tests below
+SAMPLE_INCIDENTS = 'data/input/test_data/sample_incidents_100_rows.csv'
+SAMPLE_REQUESTS = 'data/input/test_data/sample_requests_100_rows.csv'
+
+
+@pytest.mark.skipif(not load_data.PYARROW_AVAILABLE, reason="pyarrow not installed")
+def test_csv_cache_roundtrip_and_eviction(tmp_path):
+    """Cached reads match the first read; refreshed sources evict old entries
+    of the same file and engine only; cache write failures are not fatal."""
+    source = tmp_path / 'incidents.csv'
+    source.write_bytes(Path(SAMPLE_INCIDENTS).read_bytes())
+    
+    for use_pyarrow in (True, False):
+        cache_dir = tmp_path / f'cache_{use_pyarrow}'
+        first = load_data.read_csv(str(source), use_pyarrow, str(cache_dir))
+        cached = load_data.read_csv(str(source), use_pyarrow, str(cache_dir))
+        pd.testing.assert_frame_equal(first, cached)
+    
+    # Same file name in another directory keeps its own entry
+    archive = tmp_path / 'archive'
+    archive.mkdir()
+    other = archive / 'incidents.csv'
+    other.write_bytes(source.read_bytes())
+    other_entry = load_data.get_cache_path(str(other), str(cache_dir), True)
+    load_data.read_csv(str(other), True, str(cache_dir))
+    
+    load_data.read_csv(str(source), True, str(cache_dir))
+    c_engine_entry = load_data.get_cache_path(str(source), str(cache_dir), False)
+    old_entry = load_data.get_cache_path(str(source), str(cache_dir), True)
+    assert old_entry.exists()
+    os.utime(source, ns=(0, 0))
+    load_data.read_csv(str(source), True, str(cache_dir))
+    new_entry = load_data.get_cache_path(str(source), str(cache_dir), True)
+    assert new_entry != old_entry
+    assert sorted(cache_dir.glob('*.arrow')) == sorted(
+        [c_engine_entry, new_entry, other_entry])
+    
+    # An unusable cache directory falls back to the parsed frame
+    blocker = tmp_path / 'not_a_dir'
+    blocker.write_text('')
+    df = load_data.read_csv(str(source), False, str(blocker / 'cache'))
+    pd.testing.assert_frame_equal(df, first)
+
+
+def _dataframe_kpis(incidents_path, requests_path, config):
+    """Calculate KPIs through the full load/transform/calculate_all path."""
+    incidents = transform.add_incident_flags(
+        load_data.load_incidents(incidents_path, config), config)
+    requests = transform.add_request_flags(
+        load_data.load_requests(requests_path, config), config)
+    return calculate_kpis.calculate_all(incidents, requests, config)
+
+
+def test_streaming_matches_dataframe(tmp_path):
+    """calculate_all_streaming must agree with calculate_all."""
+    config = config_loader.load_config('config/kpi_config.yaml')
+    
+    expected = _dataframe_kpis(SAMPLE_INCIDENTS, SAMPLE_REQUESTS, config)
+    streamed = calculate_kpis.calculate_all_streaming(SAMPLE_INCIDENTS, SAMPLE_REQUESTS, config)
+    assert streamed == expected
+    
+    # Non-ISO (US-style) timestamps must parse the same on both paths
+    paths = []
+    for path, date_cols in ((SAMPLE_INCIDENTS, ['opened_at', 'u_resolved']),
+                            (SAMPLE_REQUESTS, ['opened_at', 'u_resolved'])):
+        raw = pd.read_csv(path, dtype=str)
+        for col in date_cols:
+            raw[col] = pd.to_datetime(raw[col]).dt.strftime('%m/%d/%Y %H:%M')
+        out = tmp_path / Path(path).name
+        raw.to_csv(out, index=False)
+        paths.append(str(out))
+    
+    expected = _dataframe_kpis(paths[0], paths[1], config)
+    streamed = calculate_kpis.calculate_all_streaming(paths[0], paths[1], config)
+    assert expected['SM002/KR4']['Backlog_Count'] > 0
+    assert streamed == expected
+    
+    # Only empty fields count as missing; unparseable values are errors
+    assert calculate_kpis._parse_timestamp('') is None
+    with pytest.raises(ValueError):
+        calculate_kpis._parse_timestamp('not a date')
+
+
+def test_chunked_matches_dataframe():
+    """calculate_all_chunked must agree with calculate_all across many chunks."""
+    config = config_loader.load_config('config/kpi_config.yaml')
+    
+    expected = _dataframe_kpis(SAMPLE_INCIDENTS, SAMPLE_REQUESTS, config)
+    for chunk_rows in (7, 1000):
+        chunked = calculate_kpis.calculate_all_chunked(
+            SAMPLE_INCIDENTS, SAMPLE_REQUESTS, config, chunk_rows=chunk_rows)
+        assert chunked == expected
+
+
 def run_all_tests():
     """Run all tests in sequence."""
     print("="*70)